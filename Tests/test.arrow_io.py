@@ -0,0 +1,71 @@
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+from src.arrow_io import Article, ArticleBatch, read_ipc, read_parquet, to_arrow, to_batch, \
+    write_ipc, write_parquet
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+
+@unittest.skipIf(pa is None, "pyarrow not installed")
+class TestArrowIO(unittest.TestCase):
+    def setUp(self):
+        self.articles = [
+            Article(url="u1", source="S1", author="A1", title="T1", description="d1",
+                    published_at="2023-10-01T09:00:00Z", content="c1"),
+            Article(url="u2", source="S2", author=None, title="T2", description=None,
+                    published_at="2023-10-02T12:00:00+02:00", content="c2"),
+            Article(url="u3", source="S1", author="A1", title="T3", description="d3",
+                    published_at=None, content=None),
+        ]
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_record_batch_types(self):
+        batch = to_arrow(self.articles)
+        self.assertEqual(batch.num_rows, 3)
+        self.assertTrue(pa.types.is_dictionary(batch.schema.field("source").type))
+        self.assertEqual(batch.column(1).dictionary.to_pylist(), ["S1", "S2"])
+        self.assertEqual(batch.column(2).to_pylist(), ["A1", None, "A1"])
+        self.assertEqual(str(batch.schema.field("published_at").type), "timestamp[us, tz=UTC]")
+        self.assertIsNone(batch.column(5)[2].as_py())
+        self.assertEqual(batch.column(5)[1].as_py().hour, 10)
+
+    def test_ipc_round_trip_memory_mapped(self):
+        path = os.path.join(self.tmp.name, "articles.arrow")
+        write_ipc(ArticleBatch.from_articles(self.articles), path, chunk_rows=2)
+        allocated = pa.total_allocated_bytes()
+        table = read_ipc(path)
+        self.assertEqual(table.num_rows, 3)
+        self.assertEqual(table.column("title").num_chunks, 2)
+        self.assertEqual(pa.total_allocated_bytes(), allocated)   # buffers live in the map
+        back = to_batch(table)
+        self.assertEqual(back.column("published_at"),
+                         ["2023-10-01T09:00:00Z", "2023-10-02T10:00:00Z", None])
+        self.assertEqual(back.column("author"), ["A1", None, "A1"])
+
+    def test_parquet_columns(self):
+        path = os.path.join(self.tmp.name, "articles.parquet")
+        write_parquet(self.articles, path, compression="snappy", row_group_size=1)
+        table = read_parquet(path, columns=["url", "source"])
+        self.assertEqual(table.column_names, ["url", "source"])
+        self.assertEqual(table.column("source").to_pylist(), ["S1", "S2", "S1"])
+
+
+class TestArrowIOWithoutPyarrow(unittest.TestCase):
+    def test_clear_import_error(self):
+        with patch.dict(sys.modules, {"pyarrow": None}):
+            with self.assertRaises(ImportError) as ctx:
+                to_arrow([])
+        self.assertIn("pip install pyarrow", str(ctx.exception))
+
+
+if __name__ == "__main__":
+    unittest.main()
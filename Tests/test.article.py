@@ -1,5 +1,6 @@
 import unittest
-from src.article import Article
+from datetime import datetime, timezone
+from src.article import Article, parse_published_at
 
 
 class TestArticle(unittest.TestCase):
@@ -36,6 +37,52 @@ class TestArticle(unittest.TestCase):
         )
         self.assertEqual(a.source, "Example Source")  # prefers name over id
 
+    def test_compact_layout_and_interning(self):
+        a = Article(**self.sample)
+        b = Article(**dict(self.sample, source="".join(["Example ", "Source"])))
+        self.assertFalse(hasattr(a, "__dict__"))
+        self.assertIs(a.source, b.source)
+        a.publishedAt = "2024-01-01T00:00:00Z"
+        self.assertEqual(a.published_at, "2024-01-01T00:00:00Z")
+
+    def test_published_datetime_parsed_and_cached(self):
+        a = Article(**self.sample)
+        dt = a.published_datetime
+        self.assertEqual(dt, datetime(2023, 10, 1, 12, 0, tzinfo=timezone.utc))
+        self.assertIs(a.published_datetime, dt)
+        a.published_at = "2023-10-02T08:00:00+02:00"
+        self.assertEqual(a.published_datetime, datetime(2023, 10, 2, 6, 0, tzinfo=timezone.utc))
+        a.publishedAt = "not a date"
+        self.assertIsNone(a.published_datetime)
+
+    def test_parse_published_at_fallbacks(self):
+        self.assertEqual(parse_published_at("2023-10-01"),
+                         datetime(2023, 10, 1, tzinfo=timezone.utc))
+        self.assertEqual(parse_published_at(" 2023-10-01T12:00:00Z "),
+                         datetime(2023, 10, 1, 12, tzinfo=timezone.utc))
+        self.assertIsNone(parse_published_at(""))
+        self.assertIsNone(parse_published_at(None))
+
+    def test_lazy_text_fields(self):
+        class Texts:
+            loads = []
+
+            def load(self, key, field):
+                self.loads.append((key, field))
+                return f"{field} {key}"
+
+        texts = Texts()
+        a = Article.lazy(texts, 7, None, url="u", title="T")
+        self.assertEqual(texts.loads, [])
+        self.assertIsNone(a.content)
+        self.assertEqual(a.description, "description 7")
+        self.assertEqual(a.description, "description 7")
+        self.assertEqual(texts.loads, [(7, "description")])   # decoded once
+        # Only keys given to Article.lazy are loaded; a plain int is a value
+        a.content = 3
+        self.assertEqual(a.content, 3)
+        self.assertEqual(texts.loads, [(7, "description")])
+
     def test_str_format(self):
         a = Article(**self.sample)
         expected = "Example Title by John Doe from Example Source on 2023-10-01T12:00:00Z"
@@ -0,0 +1,57 @@
+import unittest
+from src.article_batch import Article, ArticleBatch
+
+
+class TestArticleBatch(unittest.TestCase):
+    def setUp(self):
+        self.payload = {
+            "status": "ok",
+            "articles": [
+                {
+                    "url": "u1", "source": {"id": "s1", "name": "S1"}, "author": "A1",
+                    "title": "T1", "description": "d1",
+                    "publishedAt": "2023-10-01T00:00:00Z", "content": "c1",
+                },
+                {
+                    "url": "u2", "source": {"id": "s1", "name": "S1"}, "author": None,
+                    "title": "T2", "description": "d2",
+                    "publishedAt": "2023-10-02T00:00:00Z", "content": "c2",
+                },
+            ],
+        }
+
+    def test_from_payload_columns(self):
+        batch = ArticleBatch.from_payload(self.payload)
+        self.assertEqual(len(batch), 2)
+        self.assertEqual(batch.column("source"), ["S1", "S1"])
+        self.assertEqual(list(batch.codes("author")), [0, -1])
+        self.assertEqual(batch.categories("source"), ["S1"])
+        self.assertEqual(batch.column("published_at")[1], "2023-10-02T00:00:00Z")
+
+    def test_iterates_as_articles(self):
+        batch = ArticleBatch.from_payload(self.payload)
+        items = list(batch)
+        self.assertTrue(all(isinstance(a, Article) for a in items))
+        self.assertEqual(items[0].publishedAt, "2023-10-01T00:00:00Z")
+        self.assertIsNone(items[1].author)
+
+    def test_take_reorders(self):
+        batch = ArticleBatch.from_articles(list(ArticleBatch.from_payload(self.payload)))
+        taken = batch.take([1, 0])
+        self.assertEqual(taken.column("url"), ["u2", "u1"])
+        self.assertEqual(taken.column("author"), [None, "A1"])
+
+    def test_from_columns(self):
+        batch = ArticleBatch.from_columns({"url": ["u1", "u2"], "source": ["S1", None]})
+        self.assertEqual(list(batch.codes("source")), [0, -1])
+        self.assertEqual(batch.column("title"), [None, None])
+        with self.assertRaises(ValueError):
+            ArticleBatch.from_columns({"url": ["u1"], "title": []})
+
+    def test_error_payload_raises(self):
+        with self.assertRaises(RuntimeError):
+            ArticleBatch.from_payload({"status": "error", "code": "x", "message": "m"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+import unittest
+from src.article_dedup import Article, ArticleDeduplicator, normalize_url
+
+
+class TestArticleDedup(unittest.TestCase):
+    def test_normalize_url_drops_tracking(self):
+        self.assertEqual(
+            normalize_url("https://WWW.Example.com/story/?utm_source=x&id=2&fbclid=y#top"),
+            normalize_url("https://example.com/story?id=2"),
+        )
+        self.assertNotEqual(normalize_url("https://example.com/a?id=1"),
+                            normalize_url("https://example.com/a?id=2"))
+        for param in ("ref", "cid", "ito"):
+            self.assertNotEqual(normalize_url(f"https://example.com/a?{param}=1"),
+                                normalize_url(f"https://example.com/a?{param}=2"))
+
+    def test_exact_and_near_duplicates(self):
+        text = "Central bank raises interest rates again to fight stubborn inflation"
+        articles = [
+            Article(url="https://a.com/1?utm_medium=rss", title=text, content="Full story"),
+            Article(url="https://a.com/1", title="Other title", content="x"),
+            Article(url="https://b.com/wire", title=text, content="Full story"),
+            Article(url="https://c.com/2", title="Python 3.13 released with new JIT", content=""),
+        ]
+        dedup = ArticleDeduplicator()
+        kept = dedup.dedupe(articles)
+        self.assertEqual([a.url for a in kept], ["https://a.com/1?utm_medium=rss", "https://c.com/2"])
+        self.assertEqual(dedup.url_duplicates, 1)
+        self.assertEqual(dedup.near_duplicates, 1)
+
+    def test_bounded_memory_forgets_oldest(self):
+        dedup = ArticleDeduplicator(near=False, max_items=2)
+        for url in ("u1", "u2", "u3"):
+            self.assertFalse(dedup.is_duplicate(Article(url=url)))
+        self.assertTrue(dedup.is_duplicate(Article(url="u3")))
+        self.assertFalse(dedup.is_duplicate(Article(url="u1")))
+
+    def test_bounded_memory_refreshes_on_hit(self):
+        dedup = ArticleDeduplicator(near=False, max_items=2)
+        seen = [dedup.is_duplicate(Article(url=url)) for url in ("a", "b", "a", "c", "a")]
+        self.assertListEqual(seen, [False, False, True, False, True])
+        self.assertFalse(dedup.is_duplicate(Article(url="b")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import tempfile
+import unittest
+from src.article_index import Article, ArticleIndex
+
+
+class TestArticleIndex(unittest.TestCase):
+    def setUp(self):
+        self.articles = [
+            Article(url="u1", title="Climate change policy", description="New rules",
+                    published_at="2023-10-02T10:00:00Z"),
+            Article(url="u2", title="Change in climate talks", description=None,
+                    published_at="2023-10-01T09:00:00Z"),
+            Article(url="u3", title="Python release", description="climate of open source",
+                    published_at="2023-10-02T12:00:00Z"),
+        ]
+        self.index = ArticleIndex.from_articles(self.articles)
+
+    def urls(self, articles):
+        return [a.url for a in articles]
+
+    def test_term_results_in_date_order(self):
+        self.assertEqual(self.urls(self.index.search("climate")), ["u2", "u1", "u3"])
+
+    def test_phrase_and_or(self):
+        self.assertEqual(self.urls(self.index.search('"climate change"')), ["u1"])
+        self.assertEqual(self.urls(self.index.search("climate python")), ["u3"])
+        self.assertEqual(self.urls(self.index.search("python talks", mode="or")), ["u2", "u3"])
+
+    def test_count_by_day(self):
+        self.assertEqual(self.index.count_by_day("climate"),
+                         {"2023-10-01": 1, "2023-10-02": 2})
+
+    def test_incremental_add_and_remove(self):
+        self.assertTrue(self.index.remove("u1"))
+        self.assertFalse(self.index.remove("u1"))
+        self.index.add(Article(url="u4", title="Climate summit",
+                               published_at="2023-09-30T00:00:00Z"))
+        self.assertEqual(self.urls(self.index.search("climate")), ["u4", "u2", "u3"])
+        self.assertEqual(self.index.search("policy"), [])
+
+    def test_save_and_load(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            self.index.save(tmp)
+            loaded = ArticleIndex.load(tmp)
+            self.assertEqual(self.urls(loaded.search("climate")), ["u2", "u1", "u3"])
+            loaded.remove("u2")
+            self.assertEqual(self.urls(loaded.search("climate")), ["u1", "u3"])
+            loaded.close()
+            self.assertEqual(len(loaded), 2)
+
+    def test_load_add_save_same_directory(self):
+        articles = [Article(url=f"u{i}", title=f"z{i}") for i in range(200)]
+        with tempfile.TemporaryDirectory() as tmp:
+            ArticleIndex.from_articles(articles).save(tmp)
+            loaded = ArticleIndex.load(tmp)
+            loaded.add(Article(url="new", title="aaa " * 50))
+            loaded.save(tmp)
+            self.assertEqual(self.urls(loaded.search("z1")), ["u1"])
+            reloaded = ArticleIndex.load(tmp)
+            self.assertEqual(self.urls(reloaded.search("z1")), ["u1"])
+            self.assertEqual(self.urls(reloaded.search("aaa")), ["new"])
+            loaded.close()
+            reloaded.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+import unittest
+from src.article_store import Article, ArticleStore
+
+
+class TestArticleStore(unittest.TestCase):
+    def setUp(self):
+        self.store = ArticleStore(":memory:")
+        self.articles = [
+            Article(url="u1", source="S1", title="T1", published_at="2023-10-01T09:00:00Z"),
+            Article(url="u2", source="S2", title="T2", published_at="2023-10-02T10:00:00Z"),
+        ]
+
+    def tearDown(self):
+        self.store.close()
+
+    def test_query_key_is_normalised(self):
+        self.assertEqual(
+            ArticleStore.query_key("everything", ["Climate", "change"], "bbc.co.uk", "EN"),
+            ArticleStore.query_key("/everything", ["change", "climate"], "BBC.co.uk", "en"),
+        )
+
+    def test_upsert_by_url(self):
+        self.store.upsert(self.articles)
+        self.store.upsert([Article(url="u1", source="S1", title="T1 updated",
+                                   published_at="2023-10-01T09:00:00Z")])
+        self.assertEqual(len(self.store), 2)
+        self.assertEqual(self.store.articles(source="S1")[0].title, "T1 updated")
+
+    def test_sync_advances_high_water_mark(self):
+        key = ArticleStore.query_key("everything", ["t"])
+        self.assertIsNone(self.store.high_water_mark(key))
+        self.store.sync(key, self.articles)
+        self.assertEqual(self.store.high_water_mark(key), "2023-10-02T10:00:00Z")
+        self.store.sync(key, [])
+        self.assertEqual(self.store.high_water_mark(key), "2023-10-02T10:00:00Z")
+
+    def test_read_df(self):
+        self.store.upsert(self.articles)
+        df = self.store.read_df(start="2023-10-02")
+        self.assertListEqual(list(df["url"]), ["u2"])
+        self.assertListEqual(
+            list(df.columns),
+            ["url", "source", "author", "title", "description", "published_at", "content"],
+        )
+
+    def test_lazy_articles_read_text_on_access(self):
+        self.store.upsert([Article(url="u1", source="S1", title="T1", description="d1",
+                                   published_at="2023-10-01T09:00:00Z", content=None)])
+        article = self.store.articles(lazy=True)[0]
+        self.assertEqual(article.title, "T1")
+        self.assertIsInstance(article._description, int)
+        self.assertEqual(article.description, "d1")
+        self.assertIsNone(article.content)
+
+
+if __name__ == "__main__":
+    unittest.main()
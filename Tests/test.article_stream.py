@@ -0,0 +1,74 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from src.article_stream import Article, ResponseBuffer, iter_articles, read_batch
+
+
+class TestArticleStream(unittest.TestCase):
+    def setUp(self):
+        payload = {
+            "status": "ok",
+            "totalResults": 2,
+            "articles": [
+                {
+                    "source": {"id": None, "name": "S1"}, "author": "A1", "title": "T1",
+                    "description": "d1", "url": "u1", "urlToImage": None,
+                    "publishedAt": "2023-10-01T00:00:00Z", "content": "c1",
+                },
+                {
+                    "source": {"id": "s2", "name": None}, "author": None, "title": "T2",
+                    "description": "d2", "url": "u2", "urlToImage": None,
+                    "publishedAt": "2023-10-02T00:00:00Z", "content": "c2",
+                },
+            ],
+        }
+        self.raw = json.dumps(payload).encode("utf-8")
+
+    def test_yields_articles_across_small_chunks(self):
+        articles = list(iter_articles(io.BytesIO(self.raw), chunk_size=5))
+        self.assertTrue(all(isinstance(a, Article) for a in articles))
+        self.assertEqual([a.url for a in articles], ["u1", "u2"])
+        self.assertEqual(articles[1].source, "s2")
+        self.assertEqual(articles[0].published_at, "2023-10-01T00:00:00Z")
+
+    def test_read_batch_from_chunk_iterable(self):
+        chunks = [self.raw[i:i + 11] for i in range(0, len(self.raw), 11)]
+        batch = read_batch(chunks)
+        self.assertEqual(batch.column("title"), ["T1", "T2"])
+
+    def test_error_payload_raises(self):
+        raw = b'{"status": "error", "code": "apiKeyInvalid", "message": "Invalid key"}'
+        with self.assertRaises(RuntimeError):
+            list(iter_articles(io.BytesIO(raw)))
+
+    def test_lazy_articles_decode_on_access(self):
+        payload = json.loads(self.raw)
+        payload["articles"][0]["content"] = 'Quote \"x\" \u2019 caf\u00e9 \\ "description": y'
+        payload["articles"][1]["description"] = None
+        raw = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        articles = ResponseBuffer(raw).articles()
+        self.assertEqual([a.title for a in articles], ["T1", "T2"])
+        self.assertEqual(articles[0]._content, 1)   # not decoded yet
+        self.assertEqual(articles[0].content, payload["articles"][0]["content"])
+        self.assertIsInstance(articles[0]._content, str)
+        self.assertIsNone(articles[1].description)
+        self.assertEqual(articles[1].content, "c2")
+        self.assertEqual(articles[1].source, "s2")
+
+    def test_lazy_articles_from_mapped_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "response.json")
+            with open(path, "wb") as f:
+                f.write(self.raw)
+            buffer = ResponseBuffer.open(path)
+            articles = buffer.articles()
+            self.assertEqual([a.description for a in articles], ["d1", "d2"])
+            buffer.data.close()
+        with self.assertRaises(RuntimeError):
+            ResponseBuffer(b'{"status": "error", "code": "x", "message": "m"}').articles()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from src.cli import main
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+
+
+class TestCli(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = lambda name: os.path.join(self.tmp.name, name)
+        response = {"status": "ok", "totalResults": 2, "articles": [
+            {"url": "u1", "source": {"name": "S1"}, "author": "A1", "title": "AI news",
+             "description": "d1", "publishedAt": "2023-10-01T09:00:00Z", "content": "c1"},
+            {"url": "u2", "source": {"name": "S2"}, "author": None, "title": "More AI",
+             "description": "d2", "publishedAt": "2023-10-02T10:00:00Z", "content": "c2"},
+        ]}
+        with open(self.path("response.json"), "w") as f:
+            json.dump(response, f)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def run_jobs(self, jobs):
+        with open(self.path("jobs.json"), "w") as f:
+            json.dump({"jobs": jobs}, f)
+        code = main([self.path("jobs.json"), "--report", self.path("report.json"), "-q"])
+        with open(self.path("report.json")) as f:
+            return code, json.load(f)
+
+    def test_response_to_csv_and_chart(self):
+        code, report = self.run_jobs([{
+            "name": "saved", "response": self.path("response.json"),
+            "export": self.path("out.csv"), "charts": {self.path("ai.svg"): "AI"},
+        }])
+        self.assertEqual(code, 0)
+        self.assertEqual(report["jobs"][0]["rows"], 2)
+        self.assertListEqual(list(report["jobs"][0]["stages"]), ["load", "export", "charts"])
+        self.assertTrue(os.path.exists(self.path("out.csv")))
+        self.assertTrue(os.path.exists(self.path("ai.svg")))
+
+    def test_bad_job_reported_and_others_run(self):
+        code, report = self.run_jobs([
+            {"name": "bad"},
+            {"name": "no-path", "store": {}},
+            {"name": "bad-export", "response": self.path("response.json"), "export": 1},
+            {"name": "good", "response": self.path("response.json")},
+        ])
+        self.assertEqual(code, 1)
+        self.assertIn("exactly one", report["jobs"][0]["error"])
+        self.assertIn("needs a path", report["jobs"][1]["error"])
+        self.assertIn("error", report["jobs"][2])
+        self.assertEqual(report["jobs"][3]["articles"], 2)
+
+    def test_job_file_without_jobs_list(self):
+        for spec in ({"job": []}, {"jobs": {}}, "jobs"):
+            with open(self.path("jobs.json"), "w") as f:
+                json.dump(spec, f)
+            self.assertEqual(main([self.path("jobs.json"), "-q"]), 2)
+        with open(self.path("jobs.json"), "w") as f:
+            f.write("{not json")
+        self.assertEqual(main([self.path("jobs.json"), "-q"]), 2)
+
+    def test_light_modules_import_fast(self):
+        # Regression check: fetch-only code paths must not pull in pandas,
+        # matplotlib or numpy at import time
+        code = (
+            "import sys, time; t = time.perf_counter(); "
+            "import search_news, article, news_processor; "
+            "print(time.perf_counter() - t); "
+            "print(','.join(m for m in ('pandas', 'matplotlib', 'numpy') if m in sys.modules))"
+        )
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                             env=dict(os.environ, PYTHONPATH=SRC), check=True).stdout.split("\n")
+        self.assertEqual(out[1], "")
+        self.assertLess(float(out[0]), 0.3)
+
+
+if __name__ == "__main__":
+    unittest.main()
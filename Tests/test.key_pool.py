@@ -0,0 +1,53 @@
+import unittest
+from src.key_pool import KeyPool
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestKeyPool(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+
+    def test_weighted_round_robin(self):
+        pool = KeyPool(["A", "B"], weights=[2, 1], clock=self.clock)
+        self.assertEqual([pool.acquire() for _ in range(6)], ["A", "B", "A", "A", "B", "A"])
+        self.assertEqual([u["requests"] for u in pool.usage()], [4, 2])
+
+    def test_throttled_key_rests_then_returns(self):
+        pool = KeyPool(["A", "B"], cooldown=60, clock=self.clock)
+        pool.report("A", "rateLimited")
+        self.assertEqual({pool.acquire() for _ in range(3)}, {"B"})
+        self.assertEqual(pool.usage()[0]["state"], "throttled")
+        self.clock.now = 61
+        self.assertIn("A", {pool.acquire() for _ in range(2)})
+
+    def test_invalid_key_removed_for_good(self):
+        pool = KeyPool(["A", "B"], clock=self.clock)
+        pool.report("B", "apiKeyInvalid")
+        pool.report("A", "apiKeyExhausted")
+        self.clock.now = 10**6
+        self.assertEqual(pool.acquire(), "A")
+        pool.mark_invalid("A")
+        with self.assertRaises(RuntimeError):
+            pool.acquire()
+
+    def test_keys_never_shown(self):
+        pool = KeyPool(["SECRET1", "SECRET2"], clock=self.clock)
+        pool.mark_throttled("SECRET1")
+        pool.mark_throttled("SECRET2")
+        with self.assertRaises(RuntimeError) as ctx:
+            pool.acquire()
+        with self.assertRaises(KeyError) as missing:
+            pool.report("SECRET3", "rateLimited")
+        shown = repr(pool) + str(pool.usage()) + str(ctx.exception) + str(missing.exception)
+        self.assertNotIn("SECRET", shown)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import json
+import unittest
+from src.metrics import Histogram, MetricsRegistry
+
+
+class TestMetricsRegistry(unittest.TestCase):
+    def setUp(self):
+        self.registry = MetricsRegistry()
+
+    def test_histogram_buckets_are_cumulative(self):
+        h = Histogram([0.1, 1.0])
+        for v in (0.05, 0.1, 0.5, 3.0):
+            h.observe(v)
+        self.assertListEqual(list(h.cumulative()), [(0.1, 2), (1.0, 3), (float("inf"), 4)])
+        self.assertAlmostEqual(h.sum, 3.65)
+
+    def test_counters_by_label(self):
+        self.registry.inc("hits_total", endpoint="everything")
+        self.registry.inc("hits_total", 2, endpoint="everything")
+        self.registry.inc("hits_total", endpoint="top-headlines")
+        self.assertEqual(self.registry.get("hits_total", endpoint="everything"), 3)
+        self.assertIsNone(self.registry.get("hits_total", endpoint="sources"))
+        with self.assertRaises(ValueError):
+            self.registry.observe("hits_total", 1.0)
+
+    def test_prometheus_text(self):
+        self.registry.histogram("lat_seconds", "Latency", buckets=[0.5])
+        self.registry.observe("lat_seconds", 0.25, stage='to"df')
+        self.registry.inc("rows_total", 3)
+        text = self.registry.to_prometheus()
+        self.assertIn("# HELP lat_seconds Latency\n# TYPE lat_seconds histogram\n", text)
+        self.assertIn('lat_seconds_bucket{stage="to\\"df",le="0.5"} 1\n', text)
+        self.assertIn('lat_seconds_bucket{stage="to\\"df",le="+Inf"} 1\n', text)
+        self.assertIn('lat_seconds_count{stage="to\\"df"} 1\n', text)
+        self.assertIn("# TYPE rows_total counter\nrows_total 3\n", text)
+
+    def test_help_text_escaped(self):
+        self.registry.counter("rows_total", description="Rows\nper stage, C:\\data")
+        text = self.registry.to_prometheus()
+        self.assertIn("# HELP rows_total Rows\\nper stage, C:\\\\data\n", text)
+
+    def test_json(self):
+        self.registry.counter("rows_total", description="Rows")
+        self.registry.inc("rows_total", 2, stage="to_df")
+        self.registry.observe("lat_seconds", 0.2, stage="to_df")
+        data = json.loads(self.registry.to_json())
+        self.assertEqual(data["rows_total"],
+                         {"type": "counter", "help": "Rows",
+                          "series": [{"labels": {"stage": "to_df"}, "value": 2}]})
+        self.assertEqual(data["lat_seconds"]["series"][0]["count"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
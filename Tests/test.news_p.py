@@ -1,8 +1,11 @@
+import os
+import tempfile
 import unittest
 from unittest.mock import patch
 import pandas as pd
 from src.article import Article
-from src.news_processor import NewsProcessor
+from src.metrics import MetricsRegistry
+from src.news_processor import NewsProcessor, ArticleBatch
 
 
 class TestNewsProcessor(unittest.TestCase):
@@ -32,6 +35,25 @@ class TestNewsProcessor(unittest.TestCase):
         ]
         self.np = NewsProcessor()
 
+    def test_stage_hooks(self):
+        calls = []
+        registry = MetricsRegistry()
+        processor = NewsProcessor(hooks=[lambda *event: calls.append(event), registry.on_stage])
+        processor.to_df(self.articles + self.articles[:1], dedup=True)
+        self.assertEqual([(c[0], c[2], c[3]) for c in calls], [("dedup", 4, 3), ("to_df", 4, 3)])
+        self.assertEqual(registry.get("newsprocessor_rows_out_total", stage="to_df"), 3)
+        self.assertEqual(registry.get("newsprocessor_stage_seconds", stage="dedup").count, 1)
+
+    def test_to_df_columns_subset(self):
+        df = self.np.to_df(self.articles, sort_by="published_at",
+                           columns=NewsProcessor.META_COLUMNS)
+        self.assertListEqual(list(df.columns), NewsProcessor.META_COLUMNS)
+        self.assertListEqual(list(df["url"]), ["u2", "u1", "u3"])
+        batch_df = self.np.to_df(ArticleBatch.from_articles(self.articles), columns=["title", "url"])
+        self.assertListEqual(list(batch_df.columns), ["url", "title"])
+        with self.assertRaises(ValueError):
+            self.np.to_df(self.articles, columns=["body"])
+
     def test_to_df_no_sort_no_filter(self):
         df = self.np.to_df(self.articles)
         self.assertIsInstance(df, pd.DataFrame)
@@ -60,6 +82,119 @@ class TestNewsProcessor(unittest.TestCase):
         # first row should be the earlier date
         self.assertEqual(df.iloc[0]["published_at"], "2023-10-02T10:00:00Z")
 
+    def test_to_df_column_sort_and_query_filter(self):
+        df = self.np.to_df(self.articles, sort_by="published_at", filter_by="author.notna()")
+        self.assertListEqual(list(df["url"]), ["u1", "u3"])
+        df = self.np.to_df(self.articles, sort_by="published_at")
+        self.assertListEqual(list(df["url"]), ["u2", "u1", "u3"])
+
+    def test_to_df_mask_filter_and_parse_dates(self):
+        df = self.np.to_df(self.articles, filter_by=[True, True, False], parse_dates=True)
+        self.assertEqual(len(df), 2)
+        self.assertTrue(pd.api.types.is_datetime64_any_dtype(df["published_at"]))
+        self.assertEqual(df.iloc[1]["published_at"], pd.Timestamp("2023-10-01T09:00:00Z"))
+
+    def test_to_df_mask_filter_before_callable_sort(self):
+        for articles in (self.articles, ArticleBatch.from_articles(self.articles)):
+            df = self.np.to_df(articles, sort_by=lambda a: a.title, filter_by=[True, False, False])
+            self.assertListEqual(list(df["url"]), ["u1"])
+            df = self.np.to_df(articles, sort_by=lambda a: a.title, filter_by=[True, True, False])
+            self.assertListEqual(list(df["url"]), ["u2", "u1"])
+        with self.assertRaises(ValueError):
+            self.np.to_df(self.articles, filter_by=[True, False])
+
+    def test_to_df_legacy_filter_names(self):
+        by_mask = self.np.to_df(self.articles, filter_by=[True, False, True])
+        self.assertTrue(by_mask.equals(self.np.to_df(self.articles, filter=[True, False, True])))
+        with self.assertRaises(TypeError):
+            self.np.to_df(self.articles, filter_by=[True] * 3, filter=[True] * 3)
+        with self.assertRaises(TypeError):
+            self.np.to_df(self.articles, sort=["url"])
+
+    def test_to_df_sort_by_column_left_out(self):
+        with self.assertRaisesRegex(ValueError, "published_at"):
+            self.np.to_df(self.articles, sort_by="published_at", columns=["url", "title"])
+        df = self.np.to_df(self.articles, sort_by=["title"], columns=["url", "title"])
+        self.assertListEqual(list(df["url"]), ["u2", "u1", "u3"])
+
+    def test_to_df_parse_dates_mixed_formats(self):
+        articles = [
+            Article(url="a", published_at="2023-10-01T12:00:00Z"),
+            Article(url="b", published_at="2023-10-01T12:00:00+02:00"),
+            Article(url="c", published_at="2023-10-03"),
+            Article(url="d", published_at="garbage"),
+        ]
+        df = self.np.to_df(articles, parse_dates=True)
+        self.assertListEqual(
+            list(df["published_at"][:3]),
+            [pd.Timestamp("2023-10-01T12:00:00Z"), pd.Timestamp("2023-10-01T10:00:00Z"),
+             pd.Timestamp("2023-10-03T00:00:00Z")],
+        )
+        self.assertTrue(pd.isna(df["published_at"][3]))
+
+    def test_to_df_and_popularity_dedup(self):
+        repeated = self.articles + [self.articles[1]]
+        self.assertEqual(len(self.np.to_df(repeated)), 4)
+        self.assertEqual(len(self.np.to_df(repeated, dedup=True)), 3)
+        df = self.np.to_df(self.articles + self.articles[:1],
+                           filter_by=[True, True, True, False], dedup=True)
+        self.assertListEqual(list(df["url"]), ["u1", "u2", "u3"])
+        df = self.np.to_df(repeated, filter_by=[False, True, True, True], dedup=True)
+        self.assertListEqual(list(df["url"]), ["u2", "u3"])
+        counts = self.np.word_popularity(repeated, ["AI"], dedup=True)
+        self.assertListEqual(list(counts["AI"]), [1, 0])
+
+    def test_to_df_from_batch(self):
+        batch = ArticleBatch.from_articles(self.articles)
+        df = self.np.to_df(batch, sort_by=lambda a: a.title or "")
+        self.assertListEqual(list(df.columns), list(ArticleBatch.FIELDS))
+        self.assertEqual(df.iloc[0]["title"], "AI trends today")
+        self.assertEqual(str(df["source"].dtype), "category")
+        self.assertTrue(pd.isna(df.iloc[0]["author"]))
+
+    def test_to_df_batch_column_sort_matches_list(self):
+        articles = [Article(url="u1", source="Zeta", author="b"),
+                    Article(url="u2", source="Alpha", author=None),
+                    Article(url="u3", source="Mid", author="a")]
+        batch = ArticleBatch.from_articles(articles)
+        for sort_by in ("source", "author", ["author", "source"]):
+            self.assertListEqual(list(self.np.to_df(batch, sort_by=sort_by)["url"]),
+                                 list(self.np.to_df(articles, sort_by=sort_by)["url"]))
+        self.assertListEqual(list(self.np.to_df(batch, sort_by="source")["source"]),
+                             ["Alpha", "Mid", "Zeta"])
+
+    def test_word_popularity_counts_many_terms(self):
+        df = self.np.word_popularity(self.articles, ["AI", "python", "news"])
+        self.assertListEqual(list(df.columns), ["AI", "python", "news"])
+        self.assertListEqual(
+            [d.strftime("%Y-%m-%d") for d in df.index], ["2023-10-01", "2023-10-02"]
+        )
+        self.assertListEqual(list(df["AI"]), [1, 0])
+        self.assertListEqual(list(df["python"]), [0, 1])
+        self.assertListEqual(list(df["news"]), [0, 1])
+
+    def test_resample_popularity(self):
+        counts = self.np.word_popularity(self.articles, ["AI", "python"])
+        weekly = self.np.resample_popularity(counts, "W")   # 2023-10-01 is a Sunday
+        self.assertListEqual(weekly.values.tolist(), [[1, 0], [0, 1]])
+        monthly = self.np.resample_popularity(counts, "M")
+        self.assertListEqual(monthly.values.tolist(), [[1, 1]])
+
+    def test_headless_rendering_to_files(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            svg = os.path.join(tmp, "ai.svg")
+            fig = self.np.popularity_figure(self.articles, ["AI", "python"], path=svg)
+            self.assertEqual(len(fig.axes[0].lines), 2)
+            self.assertTrue(os.path.getsize(svg) > 0)
+
+            charts = {os.path.join(tmp, "a.png"): "AI", os.path.join(tmp, "b.png"): ["python"]}
+            written = self.np.render_popularity_charts(self.articles, charts, freq="M")
+            self.assertListEqual(written, list(charts))
+            self.assertTrue(all(os.path.getsize(path) > 0 for path in written))
+            blank = {os.path.join(tmp, "c.png"): ["AI", " "], os.path.join(tmp, "d.png"): " "}
+            written = self.np.render_popularity_charts(self.articles, blank)
+            self.assertTrue(all(os.path.getsize(path) > 0 for path in written))
+
     @patch("matplotlib.pyplot.show")
     def test_plot_word_popularity_no_crash(self, mock_show):
         # Should not raise; should call plt.show()
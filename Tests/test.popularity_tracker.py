@@ -0,0 +1,66 @@
+import os
+import tempfile
+import unittest
+from src.news_processor import NewsProcessor
+from src.popularity_tracker import Article, PopularityTracker
+
+
+def art(url, title, published_at):
+    return Article(url=url, source="S", title=title, published_at=published_at)
+
+
+class TestPopularityTracker(unittest.TestCase):
+    def setUp(self):
+        self.tracker = PopularityTracker(["AI", "python"], days=3, hours=6)
+        self.tracker.update([
+            art("u1", "AI and Python", "2023-10-01T09:00:00Z"),
+            art("u2", "More AI", "2023-10-01T11:30:00+02:00"),
+            art("u3", "Nothing", "2023-10-02T10:00:00Z"),
+            art("u4", "python tips", "2023-10-03T12:00:00Z"),
+        ])
+
+    def test_daily_series_zero_filled(self):
+        df = self.tracker.series("D")
+        self.assertEqual(df.index.name, "date")
+        self.assertListEqual(df.values.tolist(), [[2, 1], [0, 0], [0, 1]])
+
+    def test_hourly_window_and_totals(self):
+        df = self.tracker.series("H")
+        self.assertEqual(len(df), 1)   # only 12:00 on 2023-10-03 is within 6 hours
+        self.assertEqual(self.tracker.totals(), {"AI": 2, "python": 2})
+        self.assertEqual(self.tracker.totals(days=1), {"AI": 0, "python": 1})
+        self.assertEqual(self.tracker.totals(hours=6), {"AI": 0, "python": 1})
+
+    def test_old_buckets_expire_and_late_articles_ignored(self):
+        self.tracker.add(art("u5", "AI again", "2023-10-05T00:00:00Z"))
+        self.assertListEqual([d.day for d in self.tracker.series().index], [3, 4, 5])
+        self.assertFalse(self.tracker.add(art("u6", "AI", "2023-10-01T00:00:00Z")))
+        self.assertEqual(self.tracker.late, 1)
+
+    def test_days_match_word_popularity(self):
+        # Offset timestamps land on their UTC day in both
+        articles = [art("u1", "AI late", "2025-01-01T23:30:00-05:00"),
+                    art("u2", "AI morning", "2025-01-02T10:00:00+02:00"),
+                    art("u3", "AI noon", "2025-01-01T12:00:00Z")]
+        tracker = PopularityTracker(["AI"], days=5)
+        tracker.update(articles)
+        counts = NewsProcessor().word_popularity(articles, ["AI"])
+        self.assertTrue(tracker.series().equals(counts))
+        self.assertListEqual(list(counts["AI"]), [1, 2])
+
+    def test_repeated_url_counted_once(self):
+        self.tracker.add(art("u4", "python tips", "2023-10-03T12:00:00Z"))
+        self.assertEqual(self.tracker.totals(days=1), {"AI": 0, "python": 1})
+
+    def test_snapshot_restore(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "tracker.json")
+            self.tracker.snapshot(path)
+            restored = PopularityTracker.restore(path)
+        self.assertTrue(restored.series().equals(self.tracker.series()))
+        restored.add(art("u7", "AI", "2023-10-03T13:00:00Z"))
+        self.assertEqual(restored.totals(days=1), {"AI": 1, "python": 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,3 +1,4 @@
+import os
 import unittest
 import tempfile
 from unittest.mock import patch, MagicMock
@@ -18,6 +19,28 @@ class TestSearchNews(unittest.TestCase):
             s = SearchNews(tf.name)
             self.assertEqual(s.api_key, "FAKEKEY123")
 
+    def test_initialization_reads_key_per_line(self):
+        with tempfile.NamedTemporaryFile("w+", delete=True) as tf:
+            tf.write("# team keys\nKEY1\n\nKEY2\nKEY1\n")
+            tf.flush()
+            s = SearchNews(tf.name)
+            self.assertEqual(s.api_key, "KEY1")
+            self.assertEqual(len(s.keys), 2)
+            self.assertNotIn("KEY", repr(s))
+
+    def test_repeated_key_keeps_first_weight(self):
+        with patch.dict(os.environ, {"NEWSAPI_KEYS": "E1 E2 E1"}):
+            s = SearchNews("does_not_exist.txt", env_var="NEWSAPI_KEYS", weights=[3, 1, 5])
+            self.assertEqual([s.keys.acquire() for _ in range(4)].count("E1"), 3)
+            with self.assertRaises(ValueError):
+                SearchNews("does_not_exist.txt", env_var="NEWSAPI_KEYS", weights=[3, 1])
+
+    def test_initialization_from_env(self):
+        with patch.dict(os.environ, {"NEWSAPI_KEYS": "E1, E2 E3"}):
+            s = SearchNews("does_not_exist.txt", env_var="NEWSAPI_KEYS")
+        self.assertEqual(s.api_key, "E1")
+        self.assertEqual([s.keys.acquire() for _ in range(3)], ["E1", "E2", "E3"])
+
     @patch("requests.get")
     def test_get_top_headlines_success(self, mock_get):
         # Fake JSON response
@@ -0,0 +1,44 @@
+import unittest
+from src.text_analytics import Article, TextAnalytics, ngrams
+
+
+class TestTextAnalytics(unittest.TestCase):
+    def setUp(self):
+        self.articles = [
+            Article(url="u1", source="S1", title="Solar power grows",
+                    description="Solar farms expand", published_at="2023-10-01T09:00:00Z"),
+            Article(url="u2", source="S2", title="Markets rally",
+                    description="Stocks rally on rates", published_at="2023-10-01T10:00:00Z"),
+            Article(url="u3", source="S1", title="Fusion power record",
+                    description="Fusion fusion fusion", published_at="2023-10-02T10:00:00Z"),
+        ]
+
+    def test_ngrams_drop_stopwords(self):
+        self.assertEqual(ngrams("The solar power of the future", 2),
+                         ["solar power", "power future"])
+
+    def test_ngram_frequencies(self):
+        df = TextAnalytics(workers=1).ngram_frequencies(self.articles, top=2)
+        self.assertListEqual(list(df["ngram"]), ["fusion", "power"])
+        self.assertListEqual(list(df["count"]), [4, 2])
+
+    def test_tfidf_by_source_matches_across_workers(self):
+        serial = TextAnalytics(workers=1).tfidf(self.articles, by="source", top=3)
+        pooled = TextAnalytics(workers=2, chunk_size=1).tfidf(self.articles, by="source", top=3)
+        self.assertTrue(serial.equals(pooled))
+        self.assertEqual(serial[serial["source"] == "S1"].iloc[0]["ngram"], "fusion")
+
+    def test_trending(self):
+        df = TextAnalytics(workers=1).trending(self.articles, k=1)
+        self.assertEqual(df.iloc[0]["ngram"], "fusion")
+        self.assertEqual(df.iloc[0]["baseline"], 0)
+
+    def test_trending_needs_recent_and_baseline_days(self):
+        analytics = TextAnalytics(workers=1)
+        for recent_days in (0, -1, 2, 3):
+            with self.assertRaises(ValueError):
+                analytics.trending(self.articles, recent_days=recent_days)
+
+
+if __name__ == "__main__":
+    unittest.main()
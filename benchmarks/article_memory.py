@@ -0,0 +1,69 @@
+'''
+Memory benchmark for Article: bytes per article for the compact __slots__
+layout versus the previous __dict__-based layout.
+
+Run from the repository root:
+    python benchmarks/article_memory.py --count 1000000
+'''
+import argparse
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from article import Article  # noqa: E402
+
+
+class DictArticle:
+    """The previous Article layout: a per-instance __dict__, no interning."""
+
+    def __init__(self, url=None, source=None, author=None, title=None,
+                 description=None, publishedAt=None, published_at=None, content=None):
+        if isinstance(source, dict):
+            source = source.get("name") or source.get("id")
+        pub = published_at if published_at is not None else publishedAt
+        self.url = url
+        self.source = source
+        self.author = author
+        self.title = title
+        self.description = description
+        self.published_at = pub
+        self.content = content
+
+
+def make_payload(i):
+    """One NewsAPI-shaped article dict; strings are fresh objects, as after json decoding."""
+    return {
+        "url": f"https://example.com/story/{i}",
+        "source": {"id": None, "name": "".join(("Source ", str(i % 50)))},
+        "author": "".join(("Author ", str(i % 500))),
+        "title": f"Headline number {i}",
+        "description": None,
+        "publishedAt": f"2024-01-{i % 28 + 1:02d}T12:00:00Z",
+        "content": None,
+    }
+
+
+def measure(cls, count):
+    """Return traced bytes held per article after building `count` of them."""
+    tracemalloc.start()
+    articles = [cls(**make_payload(i)) for i in range(count)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del articles
+    return current / count
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Article memory benchmark")
+    parser.add_argument("-n", "--count", type=int, default=1_000_000,
+                        help="Number of articles to build")
+    args = parser.parse_args()
+
+    before = measure(DictArticle, args.count)
+    after = measure(Article, args.count)
+    print(f"articles:          {args.count}")
+    print(f"before (__dict__): {before:8.1f} bytes/article")
+    print(f"after (__slots__): {after:8.1f} bytes/article")
+    print(f"saved:             {100 * (1 - after / before):8.1f} %")
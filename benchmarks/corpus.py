@@ -0,0 +1,140 @@
+'''
+Deterministic synthetic NewsAPI corpus: response payloads and articles with
+configurable scale and skew (sources, authors, date spread, title vocabulary).
+
+The same arguments and seed always produce byte-identical output, so
+benchmark numbers from different commits are comparable.
+
+Write a corpus to disk from the repository root:
+    python benchmarks/corpus.py --count 100000 --output corpus.json
+'''
+import argparse
+import itertools
+import json
+import os
+import random
+import sys
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from article import Article  # noqa: E402
+
+# Lowercase title words; the first few double as popularity search terms
+VOCABULARY = (
+    "ai python climate election market energy health space security chip "
+    "court vaccine football startup bank housing rail strike drought merger "
+    "robot ocean tariff crypto privacy satellite wildfire inflation rocket "
+    "battery"
+).split()
+
+
+def _weights(n, skew):
+    """Zipf-like weights: rank k gets 1 / (k + 1) ** skew (skew=0 is uniform)."""
+    return list(itertools.accumulate(1.0 / (k + 1) ** skew for k in range(n)))
+
+
+class CorpusSpec:
+    """Shape of a synthetic corpus."""
+
+    def __init__(self, count=10_000, sources=50, authors=500, days=30, vocabulary=30,
+                 title_words=8, skew=1.1, missing=0.05, content_chars=200,
+                 start="2024-01-01", seed=42):
+        """
+        Args:
+            count: number of articles
+            sources: distinct source names
+            authors: distinct author names
+            days: published_at is spread over this many days from `start`
+            vocabulary: distinct title words (words beyond VOCABULARY are "wordN")
+            title_words: words per title
+            skew: Zipf exponent for source, author and word choice (0 = uniform)
+            missing: fraction of articles lacking author / description / date
+            content_chars: approximate length of each content string
+            start: first publication day (YYYY-MM-DD)
+            seed: random seed
+        """
+        self.count = count
+        self.sources = sources
+        self.authors = authors
+        self.days = days
+        self.vocabulary = vocabulary
+        self.title_words = title_words
+        self.skew = skew
+        self.missing = missing
+        self.content_chars = content_chars
+        self.start = start
+        self.seed = seed
+
+    def as_dict(self):
+        return dict(vars(self))
+
+
+def iter_items(spec):
+    """Yield NewsAPI-shaped article dicts (as found in a response's "articles")."""
+    rng = random.Random(spec.seed)
+    words = (VOCABULARY + [f"word{i}" for i in range(len(VOCABULARY), spec.vocabulary)])
+    words = words[:spec.vocabulary]
+    source_w = _weights(spec.sources, spec.skew)
+    author_w = _weights(spec.authors, spec.skew)
+    word_w = _weights(len(words), spec.skew)
+    start = datetime.strptime(spec.start, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+    span = spec.days * 86400
+    filler = "Lorem ipsum dolor sit amet consectetur adipiscing elit. "
+
+    for i in range(spec.count):
+        src = rng.choices(range(spec.sources), cum_weights=source_w)[0]
+        title = " ".join(rng.choices(words, cum_weights=word_w, k=spec.title_words))
+        published = start + timedelta(seconds=rng.randrange(span))
+        missing = rng.random() < spec.missing
+        yield {
+            "source": {"id": f"source-{src}", "name": f"Source {src}"},
+            "author": None if missing else
+            f"Author {rng.choices(range(spec.authors), cum_weights=author_w)[0]}",
+            "title": title.capitalize(),
+            "description": None if missing else f"About {title}.",
+            "url": f"https://source-{src}.example.com/{published:%Y/%m/%d}/story-{i}",
+            "urlToImage": None,
+            "publishedAt": None if missing and rng.random() < 0.5 else
+            published.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "content": (filler * (spec.content_chars // len(filler) + 1))[:spec.content_chars],
+        }
+
+
+def payload(spec):
+    """A complete NewsAPI response dict holding the whole corpus."""
+    return {"status": "ok", "totalResults": spec.count, "articles": list(iter_items(spec))}
+
+
+def payload_bytes(spec):
+    """The response as UTF-8 JSON bytes, as a server would send it."""
+    return json.dumps(payload(spec)).encode("utf-8")
+
+
+def articles(spec):
+    """The corpus as Article objects."""
+    return [Article(**{k: v for k, v in item.items() if k != "urlToImage"})
+            for item in iter_items(spec)]
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Synthetic NewsAPI corpus generator")
+    parser.add_argument("-n", "--count", type=int, default=10_000, help="Number of articles")
+    parser.add_argument("--sources", type=int, default=50, help="Distinct sources")
+    parser.add_argument("--authors", type=int, default=500, help="Distinct authors")
+    parser.add_argument("--days", type=int, default=30, help="Days spanned by published_at")
+    parser.add_argument("--vocabulary", type=int, default=30, help="Distinct title words")
+    parser.add_argument("--skew", type=float, default=1.1, help="Zipf exponent (0 = uniform)")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument("-o", "--output", default="-", help="Output file ('-' for stdout)")
+    args = parser.parse_args()
+
+    spec = CorpusSpec(count=args.count, sources=args.sources, authors=args.authors,
+                      days=args.days, vocabulary=args.vocabulary, skew=args.skew,
+                      seed=args.seed)
+    data = payload_bytes(spec)
+    if args.output == "-":
+        sys.stdout.buffer.write(data)
+    else:
+        with open(args.output, "wb") as f:
+            f.write(data)
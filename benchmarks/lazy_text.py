@@ -0,0 +1,109 @@
+'''
+Memory and construction-time benchmark for lazy description/content.
+
+Builds Articles from one synthetic NewsAPI response (see corpus.py) in
+several ways and then runs a title-only workload (to_df without the text columns):
+
+    eager          json.loads + Article(...) for every article
+    lazy (bytes)   ResponseBuffer(raw).articles(); the response bytes stay
+                   in memory and are counted as retained
+    lazy (mmap)    ResponseBuffer.open(path).articles(); the response stays
+                   in a memory-mapped file, outside the Python heap
+    store          ArticleStore.articles() from a SQLite file
+    store (lazy)   ArticleStore.articles(lazy=True): text columns not read
+
+Retained bytes are what tracemalloc still holds after construction (plus
+the response buffer for "lazy (bytes)").
+
+Run from the repository root:
+    python benchmarks/lazy_text.py --count 200000 --content-chars 1000
+'''
+import argparse
+import gc
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from article import Article  # noqa: E402
+from article_store import ArticleStore  # noqa: E402
+from article_stream import ResponseBuffer  # noqa: E402
+from news_processor import NewsProcessor  # noqa: E402
+
+from corpus import CorpusSpec, payload_bytes  # noqa: E402
+
+_FIELDS = ("url", "source", "author", "title", "description", "publishedAt", "content")
+
+
+def eager(raw, path):
+    return [Article(**{k: item.get(k) for k in _FIELDS})
+            for item in json.loads(raw)["articles"]]
+
+
+def lazy_bytes(raw, path):
+    return ResponseBuffer(raw).articles()
+
+
+def lazy_mmap(raw, path):
+    return ResponseBuffer.open(path).articles()
+
+
+def store_eager(raw, store):
+    return store.articles()
+
+
+def store_lazy(raw, store):
+    return store.articles(lazy=True)
+
+
+def measure(build, raw, source, extra):
+    gc.collect()
+    start = time.perf_counter()
+    articles = build(raw, source)
+    seconds = time.perf_counter() - start
+    del articles
+    gc.collect()
+    tracemalloc.start()
+    articles = build(raw, source)
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return articles, seconds, retained + extra
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Lazy Article text benchmark")
+    parser.add_argument("-n", "--count", type=int, default=200_000, help="Number of articles")
+    parser.add_argument("--content-chars", type=int, default=1000,
+                        help="Characters of content per article")
+    args = parser.parse_args()
+
+    raw = payload_bytes(CorpusSpec(count=args.count, content_chars=args.content_chars))
+    processor = NewsProcessor()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "response.json")
+        with open(path, "wb") as f:
+            f.write(raw)
+
+        store = ArticleStore(os.path.join(tmp, "articles.db"))
+        store.upsert(eager(raw, path))
+
+        print(f"articles: {args.count}, response: {len(raw) / 2**20:.1f} MiB")
+        print(f"{'mode':>13} {'build (s)':>10} {'retained (MiB)':>15} "
+              f"{'bytes/article':>14} {'title-only to_df (s)':>21}")
+        for name, build, source, extra in (("eager", eager, path, 0),
+                                           ("lazy (bytes)", lazy_bytes, path, len(raw)),
+                                           ("lazy (mmap)", lazy_mmap, path, 0),
+                                           ("store", store_eager, store, 0),
+                                           ("store (lazy)", store_lazy, store, 0)):
+            articles, seconds, retained = measure(build, raw, source, extra)
+            start = time.perf_counter()
+            processor.to_df(articles, columns=NewsProcessor.META_COLUMNS)
+            df_seconds = time.perf_counter() - start
+            print(f"{name:>13} {seconds:>10.3f} {retained / 2**20:>15.1f} "
+                  f"{retained / args.count:>14.0f} {df_seconds:>21.3f}")
+            del articles
+        store.close()
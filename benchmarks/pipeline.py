@@ -0,0 +1,194 @@
+'''
+End-to-end pipeline benchmark on a synthetic NewsAPI corpus (see corpus.py).
+
+Stages, each timed separately (best of --repeat runs, after one untimed
+warm-up run so lazily imported pandas is not billed to the first stage
+that uses it) with its tracemalloc peak recorded next to the wall time:
+
+    fetch_parse          HTTP GET from a local stub server, streamed into
+                         Articles by article_stream.iter_articles
+    construct            Article(**item) for every decoded article dict
+    to_df                NewsProcessor.to_df(articles)
+    to_df_sort_filter    to_df with sort_by/filter_by callables
+    to_df_columns        to_df with column sort_by/filter_by and parse_dates
+    word_popularity      NewsProcessor.word_popularity for --terms
+
+SearchNews itself has no request methods in this tree, so fetch_parse uses
+the streaming parser a response body would go through.
+
+Results are written as JSON. Pass --compare with an earlier results file to
+print per-stage ratios, e.g. across commits:
+
+    python benchmarks/pipeline.py --count 100000 --output before.json
+    git checkout ...
+    python benchmarks/pipeline.py --count 100000 --compare before.json
+'''
+import argparse
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import threading
+import time
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from article import Article  # noqa: E402
+from article_stream import iter_articles  # noqa: E402
+from news_processor import NewsProcessor  # noqa: E402
+
+from corpus import CorpusSpec, payload  # noqa: E402
+
+
+class StubServer:
+    """Serves one fixed response body on every GET, from a background thread."""
+
+    def __init__(self, body):
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v2/everything"
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def measure(fn, repeat):
+    """Best wall time over `repeat` runs, plus the traced peak of one extra run."""
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - start)
+        del result
+    gc.collect()
+    tracemalloc.start()
+    result = fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"seconds": min(times), "peak_bytes": peak, "rows": len(result)}
+
+
+def git_commit():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                             text=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+        return out.stdout.strip() or None
+    except OSError:
+        return None
+
+
+def run(spec, terms, repeat):
+    data = payload(spec)
+    items = data["articles"]
+    body = json.dumps(data).encode("utf-8")
+    del data
+    processor = NewsProcessor()
+    articles = [Article(**{k: v for k, v in item.items() if k != "urlToImage"})
+                for item in items]
+    by_date = lambda a: a.published_at or ""  # noqa: E731
+    has_author = lambda a: a.author is not None  # noqa: E731
+
+    def fetch_parse():
+        with requests.get(server.url, stream=True, timeout=60) as resp:
+            resp.raise_for_status()
+            return list(iter_articles(resp.iter_content(64 * 1024)))
+
+    stages = {
+        "fetch_parse": fetch_parse,
+        "construct": lambda: [
+            Article(**{k: v for k, v in item.items() if k != "urlToImage"}) for item in items
+        ],
+        "to_df": lambda: processor.to_df(articles),
+        "to_df_sort_filter": lambda: processor.to_df(articles, sort_by=by_date,
+                                                     filter_by=has_author),
+        "to_df_columns": lambda: processor.to_df(articles, sort_by="published_at",
+                                                 filter_by="author.notna()", parse_dates=True),
+        "word_popularity": lambda: processor.word_popularity(articles, terms),
+    }
+    results = {}
+    with StubServer(body) as server:
+        for name, fn in stages.items():
+            fn()   # warm-up: lazy imports, caches
+            results[name] = measure(fn, repeat)
+            print(f"{name:>18} {results[name]['seconds']:9.3f} s "
+                  f"{results[name]['peak_bytes'] / 2**20:9.1f} MiB peak", file=sys.stderr)
+    return {"response_bytes": len(body), "stages": results}
+
+
+def compare(current, baseline):
+    """Print per-stage time and peak-memory ratios of `current` against `baseline`."""
+    print(f"{'stage':>18} {'time':>8} {'peak':>8}   (current / baseline)", file=sys.stderr)
+    for name, now in current["stages"].items():
+        before = baseline.get("stages", {}).get(name)
+        if not before:
+            continue
+        t = now["seconds"] / before["seconds"] if before["seconds"] else float("nan")
+        m = now["peak_bytes"] / before["peak_bytes"] if before["peak_bytes"] else float("nan")
+        print(f"{name:>18} {t:7.2f}x {m:7.2f}x", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="NewsAPI pipeline benchmark")
+    parser.add_argument("-n", "--count", type=int, default=10_000, help="Number of articles")
+    parser.add_argument("--sources", type=int, default=50, help="Distinct sources")
+    parser.add_argument("--authors", type=int, default=500, help="Distinct authors")
+    parser.add_argument("--days", type=int, default=30, help="Days spanned by published_at")
+    parser.add_argument("--vocabulary", type=int, default=30, help="Distinct title words")
+    parser.add_argument("--skew", type=float, default=1.1, help="Zipf exponent (0 = uniform)")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument("--terms", nargs="+", default=["AI", "Python", "climate"],
+                        help="Search terms for word_popularity")
+    parser.add_argument("-r", "--repeat", type=int, default=3,
+                        help="Timed runs per stage (the best is reported)")
+    parser.add_argument("-o", "--output", default="-", help="Results JSON file ('-' for stdout)")
+    parser.add_argument("--compare", help="Earlier results JSON to compare against")
+    args = parser.parse_args()
+
+    spec = CorpusSpec(count=args.count, sources=args.sources, authors=args.authors,
+                      days=args.days, vocabulary=args.vocabulary, skew=args.skew,
+                      seed=args.seed)
+    report = {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "corpus": spec.as_dict(),
+        "terms": args.terms,
+        "repeat": args.repeat,
+        **run(spec, args.terms, args.repeat),
+    }
+    text = json.dumps(report, indent=2)
+    if args.output == "-":
+        print(text)
+    else:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            compare(report, json.load(f))
@@ -0,0 +1,63 @@
+'''
+Scaling benchmark for TextAnalytics: n-gram counting across 1/2/4/8 worker
+processes on synthetic articles.
+
+Run from the repository root:
+    python benchmarks/text_analytics.py --count 200000
+'''
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from article import Article  # noqa: E402
+from text_analytics import TextAnalytics  # noqa: E402
+
+
+def make_articles(count, seed=0):
+    """Synthetic articles with a Zipf-ish title/description/content vocabulary."""
+    rng = random.Random(seed)
+    vocab = [f"word{i}" for i in range(20_000)]
+    weights = [1 / (i + 1) for i in range(len(vocab))]
+
+    def text(k):
+        return " ".join(rng.choices(vocab, weights, k=k))
+
+    return [
+        Article(
+            url=f"https://example.com/story/{i}",
+            source=f"Source {i % 50}",
+            title=text(10),
+            description=text(25),
+            content=text(40),
+            published_at=f"2024-01-{i % 28 + 1:02d}T12:00:00Z",
+        )
+        for i in range(count)
+    ]
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="TextAnalytics scaling benchmark")
+    parser.add_argument("-n", "--count", type=int, default=200_000,
+                        help="Number of articles")
+    parser.add_argument("-w", "--workers", nargs="+", type=int, default=[1, 2, 4, 8],
+                        help="Worker counts to benchmark")
+    args = parser.parse_args()
+
+    articles = make_articles(args.count)
+    print(f"{args.count} articles, {os.cpu_count()} CPUs")
+    print(f"{'workers':>8} {'ngrams (s)':>11} {'tfidf/day (s)':>14} {'speedup':>8}")
+    base = None
+    for workers in args.workers:
+        analytics = TextAnalytics(workers=workers)
+        start = time.perf_counter()
+        analytics.ngram_frequencies(articles, n=2, top=100)
+        ngram_time = time.perf_counter() - start
+        start = time.perf_counter()
+        analytics.tfidf(articles, by="day")
+        tfidf_time = time.perf_counter() - start
+        base = base or ngram_time
+        print(f"{workers:>8} {ngram_time:>11.2f} {tfidf_time:>14.2f} {base / ngram_time:>7.1f}x")
@@ -0,0 +1,73 @@
+'''
+Micro-benchmark for published_at parsing: the previous scalar parser
+(strip, fromisoformat, strptime fallback inside nested try/except) versus
+parse_published_at, and pandas' generic ISO 8601 parsing versus the
+vectorised parse_published_series. Well-formed and malformed inputs are
+timed separately. (pandas' format="ISO8601" is quick on the malformed set
+because it turns most of those values into NaT rather than parsing them.)
+
+Run from the repository root:
+    python benchmarks/timestamps.py --count 1000000
+'''
+import argparse
+import os
+import sys
+import time
+from datetime import datetime
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from article import parse_published_at, parse_published_series  # noqa: E402
+
+
+def previous_parse(published_at):
+    """The parsing done by _extract_date_from_published before this change."""
+    if not published_at:
+        return None
+    s = str(published_at).strip()
+    try:
+        if s.endswith("Z"):
+            s = s[:-1] + "+00:00"
+        return datetime.fromisoformat(s)
+    except Exception:
+        try:
+            return datetime.strptime(s[:10], "%Y-%m-%d")
+        except Exception:
+            return None
+
+
+def well_formed(count):
+    return [f"2024-{i % 12 + 1:02d}-{i % 28 + 1:02d}T{i % 24:02d}:{i % 60:02d}:00Z"
+            for i in range(count)]
+
+
+def malformed(count):
+    shapes = ("2024-{m:02d}-{d:02d}", "2024-{m:02d}-{d:02d} 10:00", " 2024-{m:02d}-{d:02d}T10:00:00Z ",
+              "2024-{m:02d}-{d:02d}T10:00:00.123+02:00", "{d}/{m}/2024", "")
+    return [shapes[i % len(shapes)].format(m=i % 12 + 1, d=i % 28 + 1) for i in range(count)]
+
+
+def timed(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="published_at parsing benchmark")
+    parser.add_argument("-n", "--count", type=int, default=1_000_000,
+                        help="Number of timestamps per input set")
+    args = parser.parse_args()
+
+    print(f"{'input':>12} {'previous (s)':>13} {'scalar (s)':>11} "
+          f"{'pandas ISO (s)':>15} {'vectorised (s)':>15}")
+    for name, values in (("well-formed", well_formed(args.count)),
+                         ("malformed", malformed(args.count))):
+        series = pd.Series(values, dtype=object)
+        old = timed(lambda: [previous_parse(v) for v in values])
+        new = timed(lambda: [parse_published_at(v) for v in values])
+        iso = timed(lambda: pd.to_datetime(series, format="ISO8601", utc=True, errors="coerce"))
+        vec = timed(lambda: parse_published_series(series))
+        print(f"{name:>12} {old:>13.2f} {new:>11.2f} {iso:>15.2f} {vec:>15.2f}")
@@ -0,0 +1,78 @@
+'''
+Benchmark for NewsProcessor.to_df: the original per-row implementation
+(filter/sort in Python, one dict per article), to_df with callables, and
+to_df with column expressions evaluated vectorised by pandas.
+
+Run from the repository root:
+    python benchmarks/to_df.py --sizes 10000 100000 1000000
+'''
+import argparse
+import os
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from article import Article  # noqa: E402
+from news_processor import NewsProcessor  # noqa: E402
+
+
+def make_articles(count):
+    """Synthetic articles with a mix of missing authors and dates."""
+    return [
+        Article(
+            url=f"https://example.com/story/{i}",
+            source={"id": None, "name": f"Source {i % 50}"},
+            author=None if i % 4 == 0 else f"Author {i % 500}",
+            title=f"Headline number {i}",
+            description="Description",
+            publishedAt=None if i % 97 == 0 else
+            f"2024-{i % 12 + 1:02d}-{i % 28 + 1:02d}T{i % 24:02d}:00:00Z",
+            content="Content",
+        )
+        for i in range(count)
+    ]
+
+
+def original_to_df(articles, sort_by=None, filter=None):
+    """to_df as it was before the column fast path."""
+    items = list(articles or [])
+    if filter is not None:
+        items = [a for a in items if filter(a)]
+    if sort_by is not None:
+        items = sorted(items, key=sort_by)
+    records = [{name: getattr(a, name) for name in NewsProcessor.COLUMNS} for a in items]
+    return pd.DataFrame.from_records(records, columns=NewsProcessor.COLUMNS)
+
+
+def timed(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="to_df benchmark")
+    parser.add_argument("-s", "--sizes", nargs="+", type=int,
+                        default=[10_000, 100_000, 1_000_000],
+                        help="Article counts to benchmark")
+    args = parser.parse_args()
+
+    processor = NewsProcessor()
+    by_date = lambda a: a.published_at or ""  # noqa: E731
+    has_author = lambda a: a.author is not None  # noqa: E731
+    print(f"{'articles':>10} {'original (s)':>13} {'callables (s)':>14} "
+          f"{'columns (s)':>12} {'speedup':>8}")
+    for size in args.sizes:
+        articles = make_articles(size)
+        slow = timed(lambda: original_to_df(articles, sort_by=by_date, filter=has_author))
+        mid = timed(lambda: processor.to_df(articles, sort_by=by_date, filter_by=has_author))
+        fast = timed(lambda: processor.to_df(
+            articles,
+            sort_by="published_at",
+            filter_by="author.notna()",
+            parse_dates=True,
+        ))
+        print(f"{size:>10} {slow:>13.3f} {mid:>14.3f} {fast:>12.3f} {slow / fast:>7.1f}x")
@@ -0,0 +1,145 @@
+from typing import List, Optional, Sequence, Union
+from article import Article, parse_published_series
+from article_batch import ArticleBatch
+
+# Rows per record batch in IPC files, so readers can stream large dumps
+DEFAULT_CHUNK_ROWS = 64 * 1024
+
+
+def _pyarrow():
+    """Import pyarrow on first use; it is an optional dependency."""
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError(
+            "Arrow/Parquet support needs the optional pyarrow package: pip install pyarrow"
+        ) from e
+    return pyarrow
+
+
+def schema():
+    """
+    Arrow schema of exported articles: source and author dictionary-encoded,
+    published_at a UTC timestamp (null if missing or unparseable).
+    """
+    pa = _pyarrow()
+    text = pa.dictionary(pa.int32(), pa.string())
+    return pa.schema([
+        ("url", pa.string()),
+        ("source", text),
+        ("author", text),
+        ("title", pa.string()),
+        ("description", pa.string()),
+        ("published_at", pa.timestamp("us", tz="UTC")),
+        ("content", pa.string()),
+    ])
+
+
+def to_arrow(articles: Union[List[Article], ArticleBatch]):
+    """
+    Articles as a pyarrow.RecordBatch with schema(). The source/author codes
+    of an ArticleBatch become the dictionary indices as they are.
+    """
+    pa = _pyarrow()
+    import numpy as np
+
+    batch = articles if isinstance(articles, ArticleBatch) else \
+        ArticleBatch.from_articles(articles or [])
+    target = schema()
+    arrays = []
+    for field in target:
+        name = field.name
+        if name in ("source", "author"):
+            codes = np.asarray(batch.codes(name), dtype=np.int32)
+            arrays.append(pa.DictionaryArray.from_arrays(
+                pa.array(codes, mask=codes < 0),
+                pa.array(batch.categories(name), type=pa.string()),
+            ))
+        elif name == "published_at":
+            import pandas as pd
+            parsed = parse_published_series(pd.Series(batch.column(name), dtype=object))
+            arrays.append(pa.Array.from_pandas(parsed, type=field.type))
+        else:
+            arrays.append(pa.array(batch.column(name), type=field.type))
+    return pa.RecordBatch.from_arrays(arrays, schema=target)
+
+
+def _table(data):
+    pa = _pyarrow()
+    if isinstance(data, pa.Table):
+        return data
+    if isinstance(data, pa.RecordBatch):
+        return pa.Table.from_batches([data])
+    return pa.Table.from_batches([to_arrow(data)])
+
+
+def write_parquet(data, path: str, compression: str = "zstd",
+                  row_group_size: Optional[int] = 128 * 1024) -> None:
+    """
+    Write articles (a list, ArticleBatch, RecordBatch or Table) to a
+    Parquet file.
+
+    Args:
+        compression: codec per column chunk ("zstd", "snappy", "gzip", "none", ...)
+        row_group_size: maximum rows per row group; smaller groups let
+            readers skip more with filters, larger ones compress better
+    """
+    _pyarrow()
+    import pyarrow.parquet as pq
+    pq.write_table(_table(data), path, compression=compression, row_group_size=row_group_size)
+
+
+def write_ipc(data, path: str, chunk_rows: int = DEFAULT_CHUNK_ROWS,
+              compression: Optional[str] = None) -> None:
+    """
+    Write articles to an Arrow IPC file in record batches of `chunk_rows`.
+    Leave compression off (the default) for files meant to be
+    memory-mapped by read_ipc(); compressed buffers have to be decoded
+    into memory.
+    """
+    pa = _pyarrow()
+    table = _table(data)
+    options = pa.ipc.IpcWriteOptions(compression=compression)
+    with pa.OSFile(path, "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema, options=options) as writer:
+            writer.write_table(table, max_chunksize=chunk_rows)
+
+
+def read_ipc(path: str, columns: Optional[Sequence[str]] = None):
+    """
+    Open an Arrow IPC file as a pyarrow.Table backed by a memory map:
+    uncompressed column buffers point straight into the mapped file, so a
+    multi-GB dump is not copied into the Python heap and pages are only
+    read as columns are touched.
+    """
+    pa = _pyarrow()
+    source = pa.memory_map(path, "r")
+    table = pa.ipc.open_file(source).read_all()
+    return table.select(list(columns)) if columns is not None else table
+
+
+def read_parquet(path: str, columns: Optional[Sequence[str]] = None):
+    """Read a Parquet file (optionally only some columns) as a pyarrow.Table."""
+    _pyarrow()
+    import pyarrow.parquet as pq
+    return pq.read_table(path, columns=list(columns) if columns is not None else None,
+                         memory_map=True)
+
+
+def to_batch(data) -> ArticleBatch:
+    """
+    Convert a Table or RecordBatch from this module back into an
+    ArticleBatch, with published_at as "YYYY-MM-DDTHH:MM:SSZ" strings.
+    """
+    pa = _pyarrow()
+    import pyarrow.compute as pc
+    table = _table(data)
+    columns = {}
+    for name in table.column_names:
+        col = table.column(name)
+        if pa.types.is_timestamp(col.type):
+            # At sub-second units %S would include the fraction
+            seconds = col.cast(pa.timestamp("s", tz=col.type.tz), safe=False)
+            col = pc.strftime(seconds, format="%Y-%m-%dT%H:%M:%SZ")
+        columns[name] = col.to_pylist()
+    return ArticleBatch.from_columns(columns)
@@ -1,3 +1,89 @@
+import sys
+from datetime import datetime, timezone
+from typing import Optional
+from lazy_import import LazyModule
+
+pd = LazyModule("pandas")
+
+# NewsAPI's canonical publishedAt form, e.g. "2023-10-01T12:00:00Z", minus the "Z"
+CANONICAL_PUBLISHED_FORMAT = "%Y-%m-%dT%H:%M:%S"
+
+
+def parse_published_at(value) -> Optional[datetime]:
+    """
+    Parse a published_at value into a timezone-aware datetime.
+
+    The canonical "YYYY-MM-DDTHH:MM:SSZ" form is recognised by its shape and
+    parsed with a single fromisoformat call. Other ISO 8601 strings keep
+    their UTC offset (naive results are taken as UTC), and anything else
+    falls back to its leading YYYY-MM-DD at midnight UTC. Returns None for
+    empty or unparseable values.
+    """
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+    s = str(value)
+    if len(s) == 20 and s[19] == "Z":
+        try:
+            return datetime.fromisoformat(s[:19] + "+00:00")
+        except ValueError:
+            pass
+
+    s = s.strip()
+    if not s:
+        return None
+    try:
+        dt = datetime.fromisoformat(s[:-1] + "+00:00" if s.endswith("Z") else s)
+    except ValueError:
+        # %Y needs four digits, so nothing without "-" at index 4 can match
+        if s[4:5] != "-":
+            return None
+        try:
+            dt = datetime.strptime(s[:10], "%Y-%m-%d")
+        except ValueError:
+            return None
+    return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+
+
+def parse_published_series(values: "pd.Series") -> "pd.Series":
+    """
+    Vectorised parse_published_at for a pandas Series: UTC datetimes (NaT
+    if missing or unparseable). Already-parsed datetime columns pass through.
+    """
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values
+    text = values.tolist()
+    # Vectorised fast path for the canonical "YYYY-MM-DDTHH:MM:SSZ" form
+    canonical = [s[:19] if type(s) is str and len(s) == 20 and s[19] == "Z" else None
+                 for s in text]
+    parsed = pd.to_datetime(
+        pd.Series(canonical, index=values.index, dtype=object),
+        format=CANONICAL_PUBLISHED_FORMAT, errors="coerce",
+    ).dt.as_unit("us")
+    # Anything else goes through the scalar parser, converted to UTC; odd
+    # values tend to repeat, so each distinct one is parsed once
+    retry = [i for i, (s, c) in enumerate(zip(text, canonical)) if c is None and s is not None]
+    if retry:
+        seen = {}
+        utc = []
+        for i in retry:
+            value = text[i]
+            if value not in seen:
+                dt = parse_published_at(value)
+                if dt is not None and dt.tzinfo is not timezone.utc:
+                    dt = dt.astimezone(timezone.utc)
+                seen[value] = dt.replace(tzinfo=None) if dt else None
+            utc.append(seen[value])
+        parsed.iloc[retry] = pd.to_datetime(pd.Series(utc, dtype=object)).dt.as_unit("us")
+    return parsed.dt.tz_localize("UTC")
+
+
+class TextKey(int):
+    """Key of a description/content not loaded yet (see Article.lazy)."""
+    __slots__ = ()
+
+
 class Article:
     """
     Class to store details of a news article from the News API.
@@ -10,14 +96,37 @@ class Article:
         description: A brief description of the article
         published_at: The date/time the article was published (ISO string)
         content: The content of the article
+        published_datetime: published_at parsed to a timezone-aware datetime
+            (None if missing/unparseable); parsed on first access and cached
+
+    Articles use __slots__ rather than a per-instance __dict__, and the
+    low-cardinality source and author strings are interned, so large
+    archives of articles share one copy of each name.
+
+    description and content may also be lazy (see Article.lazy): the article
+    then holds only TextKey keys into a backing text source, such as a
+    retained response buffer or an ArticleStore, and each field is decoded
+    into a str on first access.
     """
 
+    __slots__ = ("url", "source", "author", "title", "_description",
+                 "_published_at", "_published_dt", "_content", "_texts")
+
+    # Marks published_datetime as not parsed yet (Ellipsis stays a singleton through pickling)
+    _UNPARSED = Ellipsis
+
     def __init__(self, url=None, source=None, author=None, title=None,
                  description=None, publishedAt=None, published_at=None, content=None):
         # Normalize source: NewsAPI often returns a dict {"id": ..., "name": ...}
         if isinstance(source, dict):
             source = source.get("name") or source.get("id")
 
+        # Source names and authors repeat across many articles; share one copy
+        if isinstance(source, str):
+            source = sys.intern(source)
+        if isinstance(author, str):
+            author = sys.intern(author)
+
         # Prefer snake_case published_at; fall back to camelCase arg
         pub = published_at if published_at is not None else publishedAt
 
@@ -25,9 +134,65 @@ class Article:
         self.source = source
         self.author = author
         self.title = title
-        self.description = description
+        self._description = description
         self.published_at = pub
-        self.content = content
+        self._content = content
+        self._texts = None
+
+    @classmethod
+    def lazy(cls, texts, description_key: Optional[int], content_key: Optional[int],
+             **fields) -> "Article":
+        """
+        An Article whose description and content are loaded on first access
+        with texts.load(key, field). A None key means the field is None.
+        """
+        article = cls(**fields)
+        article._texts = texts
+        if description_key is not None:
+            article._description = TextKey(description_key)
+        if content_key is not None:
+            # One key for both fields (e.g. a store rowid) is shared, not copied
+            article._content = article._description if content_key == description_key \
+                else TextKey(content_key)
+        return article
+
+    @property
+    def description(self):
+        value = self._description
+        if type(value) is TextKey:
+            value = self._description = self._texts.load(int(value), "description")
+        return value
+
+    @description.setter
+    def description(self, value):
+        self._description = value
+
+    @property
+    def content(self):
+        value = self._content
+        if type(value) is TextKey:
+            value = self._content = self._texts.load(int(value), "content")
+        return value
+
+    @content.setter
+    def content(self, value):
+        self._content = value
+
+    @property
+    def published_at(self):
+        return self._published_at
+
+    @published_at.setter
+    def published_at(self, value):
+        self._published_at = value
+        self._published_dt = Article._UNPARSED
+
+    @property
+    def published_datetime(self):
+        dt = self._published_dt
+        if dt is Article._UNPARSED:
+            dt = self._published_dt = parse_published_at(self._published_at)
+        return dt
 
     # Backward-compat: camelCase alias so code/tests using publishedAt don't break
     @property
@@ -0,0 +1,165 @@
+from array import array
+from typing import Dict, Iterable, Iterator, Mapping, Sequence
+from article import Article
+
+
+class ArticleBatch:
+    """
+    Columnar container for many news articles.
+
+    Stores the seven Article fields as parallel columns instead of one object
+    per article. The low-cardinality source and author columns are dictionary
+    encoded (int32 codes in an array.array into a list of distinct values, -1
+    for missing), so they map straight onto pandas categoricals. The text
+    columns stay Python lists of str: pandas converts object strings to its
+    own string dtype when building a DataFrame, so NumPy object arrays would
+    be copied all the same.
+
+    Iterating a batch yields Article views, so code written for list[Article]
+    keeps working.
+    """
+
+    FIELDS = ("url", "source", "author", "title", "description", "published_at", "content")
+    _CODED = ("source", "author")
+
+    def __init__(self):
+        self._columns: Dict[str, list] = {
+            "url": [], "title": [], "description": [], "published_at": [], "content": [],
+        }
+        self._codes: Dict[str, array] = {"source": array("i"), "author": array("i")}
+        self._categories: Dict[str, list] = {"source": [], "author": []}
+        self._lookup: Dict[str, dict] = {"source": {}, "author": {}}
+
+    @classmethod
+    def from_articles(cls, articles: Iterable[Article]) -> "ArticleBatch":
+        """Build a batch from Article objects."""
+        batch = cls()
+        for a in articles:
+            batch._append_row(a.url, a.source, a.author, a.title,
+                              a.description, a.published_at, a.content)
+        return batch
+
+    @classmethod
+    def from_columns(cls, columns: Mapping[str, Sequence]) -> "ArticleBatch":
+        """
+        Build a batch from one equal-length sequence per field (see FIELDS;
+        missing fields are all None).
+        """
+        lengths = {len(col) for col in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("columns must all have the same length")
+        n = lengths.pop() if lengths else 0
+        batch = cls()
+        for name in cls.FIELDS:
+            values = list(columns[name]) if name in columns else [None] * n
+            if name in cls._CODED:
+                batch._codes[name] = array("i", [batch._encode(name, v) for v in values])
+            else:
+                batch._columns[name] = values
+        return batch
+
+    @classmethod
+    def from_payload(cls, payload: dict) -> "ArticleBatch":
+        """
+        Build a batch straight from a decoded NewsAPI response.
+
+        Args:
+            payload: dict with "status" and "articles" as returned by the API
+
+        Raises:
+            RuntimeError: if the payload reports status "error"
+        """
+        if payload.get("status") == "error":
+            raise RuntimeError(
+                f"NewsAPI error ({payload.get('code')}): {payload.get('message')}"
+            )
+        batch = cls()
+        for item in payload.get("articles") or []:
+            source = item.get("source")
+            if isinstance(source, dict):
+                source = source.get("name") or source.get("id")
+            pub = item.get("published_at")
+            if pub is None:
+                pub = item.get("publishedAt")
+            batch._append_row(item.get("url"), source, item.get("author"), item.get("title"),
+                              item.get("description"), pub, item.get("content"))
+        return batch
+
+    def append(self, article: Article) -> None:
+        """Add one Article to the end of the batch."""
+        self._append_row(article.url, article.source, article.author, article.title,
+                         article.description, article.published_at, article.content)
+
+    def _append_row(self, url, source, author, title, description, published_at, content):
+        cols = self._columns
+        cols["url"].append(url)
+        cols["title"].append(title)
+        cols["description"].append(description)
+        cols["published_at"].append(published_at)
+        cols["content"].append(content)
+        self._codes["source"].append(self._encode("source", source))
+        self._codes["author"].append(self._encode("author", author))
+
+    def _encode(self, field: str, value) -> int:
+        if value is None:
+            return -1
+        lookup = self._lookup[field]
+        code = lookup.get(value)
+        if code is None:
+            code = lookup[value] = len(self._categories[field])
+            self._categories[field].append(value)
+        return code
+
+    def __len__(self) -> int:
+        return len(self._columns["url"])
+
+    def __getitem__(self, i: int) -> Article:
+        cols = self._columns
+        return Article(
+            url=cols["url"][i],
+            source=self._decode("source", i),
+            author=self._decode("author", i),
+            title=cols["title"][i],
+            description=cols["description"][i],
+            published_at=cols["published_at"][i],
+            content=cols["content"][i],
+        )
+
+    def __iter__(self) -> Iterator[Article]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def _decode(self, field: str, i: int):
+        code = self._codes[field][i]
+        return None if code < 0 else self._categories[field][code]
+
+    def column(self, name: str) -> list:
+        """Return one field as a list of values (decoded for source/author)."""
+        if name in self._CODED:
+            cats = self._categories[name]
+            return [None if c < 0 else cats[c] for c in self._codes[name]]
+        return self._columns[name]
+
+    def codes(self, name: str) -> array:
+        """Dictionary codes for "source" or "author" as int32 (-1 means missing)."""
+        return self._codes[name]
+
+    def categories(self, name: str) -> list:
+        """Distinct values for "source" or "author", indexed by code."""
+        return self._categories[name]
+
+    def take(self, indices: Sequence[int]) -> "ArticleBatch":
+        """Return a new batch with the given rows, in the given order."""
+        batch = ArticleBatch()
+        for name, col in self._columns.items():
+            batch._columns[name] = [col[i] for i in indices]
+        for name in self._CODED:
+            codes = self._codes[name]
+            batch._codes[name] = array("i", [codes[i] for i in indices])
+            batch._categories[name] = list(self._categories[name])
+            batch._lookup[name] = dict(self._lookup[name])
+        return batch
+
+    def __repr__(self):
+        return f"ArticleBatch({len(self)} articles)"
+
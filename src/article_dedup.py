@@ -0,0 +1,171 @@
+from collections import OrderedDict
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Union
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+import numpy as np
+from article import Article
+from article_batch import ArticleBatch
+from article_index import tokenize
+
+# Query parameters that only track where a click came from. Generic names
+# such as ref, cid or id are left alone: sites also use them for content.
+TRACKING_PARAMS = {
+    "fbclid", "gclid", "dclid", "msclkid", "mc_cid", "mc_eid", "igshid", "ref_src",
+}
+
+
+def normalize_url(url: Optional[str]) -> Optional[str]:
+    """
+    Canonical form of an article URL for exact deduplication: lowercase
+    scheme/host without "www.", no fragment, no tracking parameters
+    (utm_* and TRACKING_PARAMS), remaining parameters sorted, no trailing slash.
+    """
+    if not url:
+        return None
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    query = sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith("utm_") and k.lower() not in TRACKING_PARAMS
+    )
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit((parts.scheme.lower(), host, path, urlencode(query), ""))
+
+
+def shingle_hashes(tokens: List[str]) -> np.ndarray:
+    """
+    64-bit hashes of the word bigrams (or the single word) in `tokens`.
+
+    Uses Python's built-in hash, so values are only comparable within one
+    process (which is all the in-memory deduplicator needs).
+    """
+    shingles = list(zip(tokens, tokens[1:])) or [tuple(tokens)]
+    return np.fromiter((hash(s) for s in shingles), dtype=np.int64,
+                       count=len(shingles)).view(np.uint64)
+
+
+class MinHasher:
+    """MinHash signatures over shingle sets, one uint32 per hash function."""
+
+    def __init__(self, num_perm: int = 32, seed: int = 1):
+        rng = np.random.default_rng(seed)
+        self.num_perm = num_perm
+        self._masks = rng.integers(0, 2**63, size=num_perm, dtype=np.uint64)
+        self._mults = rng.integers(0, 2**63, size=num_perm, dtype=np.uint64) | np.uint64(1)
+
+    def signature(self, tokens: List[str]) -> np.ndarray:
+        hashes = shingle_hashes(tokens)[:, None]
+        # (h ^ mask) * odd multiplier, wrapping mod 2**64, keeping the high bits
+        mixed = ((hashes ^ self._masks) * self._mults) >> np.uint64(32)
+        return mixed.min(axis=0).astype(np.uint32)
+
+
+class ArticleDeduplicator:
+    """
+    Drops repeated articles from a stream of Articles.
+
+    An article is a duplicate if its normalised URL was already seen, or
+    (with near=True) if the estimated Jaccard similarity of its title+content
+    bigrams to an earlier article's is at least `threshold`. MinHash
+    signatures are split into `bands` bands and bucketed per band (LSH), so
+    only articles sharing a bucket are compared and the cost stays
+    sub-quadratic.
+
+    With `max_items` set, only that many most recently seen articles are
+    remembered (least recently used first out; a duplicate hit counts as a
+    use), which bounds memory for long-running streams.
+    """
+
+    def __init__(self, near: bool = True, threshold: float = 0.8, num_perm: int = 32,
+                 bands: int = 8, min_tokens: int = 3, max_items: Optional[int] = None):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.near = near
+        self.threshold = threshold
+        self.min_tokens = min_tokens
+        self.max_items = max_items
+        self._hasher = MinHasher(num_perm)
+        self._bands = bands
+        self._rows = num_perm // bands
+        self._seen: "OrderedDict[int, tuple]" = OrderedDict()   # entry id -> (url key, signature)
+        self._urls: Dict[str, int] = {}
+        self._buckets: Dict[tuple, Set[int]] = {}
+        self._next_id = 0
+        self.url_duplicates = 0
+        self.near_duplicates = 0
+
+    def _band_keys(self, sig: np.ndarray) -> List[tuple]:
+        r = self._rows
+        return [(b, sig[b * r:(b + 1) * r].tobytes()) for b in range(self._bands)]
+
+    def is_duplicate(self, article: Article) -> bool:
+        """Check `article` against everything seen so far and remember it if new."""
+        url_key = normalize_url(article.url)
+        if url_key is not None and url_key in self._urls:
+            self.url_duplicates += 1
+            self._seen.move_to_end(self._urls[url_key])
+            return True
+
+        sig = None
+        if self.near:
+            tokens = tokenize(article.title) + tokenize(article.content)
+            if len(tokens) >= self.min_tokens:
+                sig = self._hasher.signature(tokens)
+                needed = self.threshold * len(sig)
+                checked = set()
+                for key in self._band_keys(sig):
+                    for other in self._buckets.get(key, ()):
+                        if other in checked:
+                            continue
+                        checked.add(other)
+                        if np.count_nonzero(sig == self._seen[other][1]) >= needed:
+                            self.near_duplicates += 1
+                            self._seen.move_to_end(other)
+                            return True
+
+        self._remember(url_key, sig)
+        return False
+
+    def _remember(self, url_key: Optional[str], sig: Optional[np.ndarray]) -> None:
+        entry = self._next_id
+        self._next_id += 1
+        self._seen[entry] = (url_key, sig)
+        if url_key is not None:
+            self._urls[url_key] = entry
+        if sig is not None:
+            for key in self._band_keys(sig):
+                self._buckets.setdefault(key, set()).add(entry)
+        if self.max_items is not None and len(self._seen) > self.max_items:
+            self._forget(*self._seen.popitem(last=False))
+
+    def _forget(self, entry: int, value: tuple) -> None:
+        url_key, sig = value
+        if url_key is not None and self._urls.get(url_key) == entry:
+            del self._urls[url_key]
+        if sig is not None:
+            for key in self._band_keys(sig):
+                bucket = self._buckets[key]
+                bucket.discard(entry)
+                if not bucket:
+                    del self._buckets[key]
+
+    def filter(self, articles: Iterable[Article]) -> Iterator[Article]:
+        """Yield only the first occurrence of each article, lazily."""
+        for a in articles:
+            if not self.is_duplicate(a):
+                yield a
+
+    def dedupe(
+        self,
+        articles: Union[List[Article], ArticleBatch],
+    ) -> Union[List[Article], ArticleBatch]:
+        """Deduplicated copy of a list, or of a batch (returned as a batch)."""
+        if isinstance(articles, ArticleBatch):
+            return articles.take([i for i, a in enumerate(articles) if not self.is_duplicate(a)])
+        return list(self.filter(articles or []))
+
+    @property
+    def duplicates(self) -> int:
+        """Total duplicates dropped so far (URL and near duplicates)."""
+        return self.url_duplicates + self.near_duplicates
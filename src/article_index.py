@@ -0,0 +1,238 @@
+import json
+import mmap
+import os
+import re
+from array import array
+from bisect import bisect_left, insort
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+from article import Article
+
+_TOKEN_RE = re.compile(r"\w+")
+_CLAUSE_RE = re.compile(r'"([^"]*)"|(\S+)')
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Lowercase word tokens of `text` (empty list for None)."""
+    return _TOKEN_RE.findall(text.lower()) if text else []
+
+
+class ArticleIndex:
+    """
+    Inverted index over article titles and descriptions.
+
+    Each token maps to a postings list of document ids kept in published_at
+    order (ISO string order, undated articles first), so term queries and
+    per-day counts only touch the postings of the query terms.
+
+    Articles are keyed by URL: adding an article whose URL is already indexed
+    replaces the old entry.
+
+    Query syntax for search()/count_by_day(): whitespace-separated words and
+    "quoted phrases", combined with mode="and" (all must match) or
+    mode="or" (any may match).
+    """
+
+    def __init__(self):
+        self._docs: Dict[int, Article] = {}
+        self._ids_by_url: Dict[str, int] = {}
+        self._postings: Dict[str, List[int]] = {}
+        self._next_id = 0
+        # Postings still backed by a memory-mapped file, see load()
+        self._mapped_lexicon: Dict[str, Tuple[int, int]] = {}
+        self._mapped: Optional[memoryview] = None
+        self._mmap: Optional[mmap.mmap] = None
+
+    @classmethod
+    def from_articles(cls, articles: Iterable[Article]) -> "ArticleIndex":
+        """Build an index from Article objects (or an ArticleBatch)."""
+        index = cls()
+        for a in articles:
+            index.add(a)
+        return index
+
+    @classmethod
+    def from_df(cls, df) -> "ArticleIndex":
+        """Build an index from a DataFrame produced by NewsProcessor.to_df."""
+        index = cls()
+        for row in df.to_dict("records"):
+            fields = {}
+            for name, value in row.items():
+                if value is None or value != value:   # None / NaN / NaT
+                    value = None
+                elif hasattr(value, "isoformat"):
+                    value = value.isoformat()
+                fields[name] = value
+            index.add(Article(**fields))
+        return index
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def _sort_key(self, doc_id: int) -> Tuple[str, int]:
+        return (self._docs[doc_id].published_at or "", doc_id)
+
+    def _tokens(self, article: Article) -> List[str]:
+        return tokenize(article.title) + tokenize(article.description)
+
+    def _ids(self, token: str) -> Sequence[int]:
+        """Postings for `token`, in date order, without copying mapped ones."""
+        if token in self._postings:
+            return self._postings[token]
+        if token in self._mapped_lexicon:
+            offset, length = self._mapped_lexicon[token]
+            return self._mapped[offset:offset + length]
+        return ()
+
+    def _writable_ids(self, token: str) -> List[int]:
+        if token in self._mapped_lexicon:
+            self._postings[token] = list(self._ids(token))
+            del self._mapped_lexicon[token]
+        return self._postings.setdefault(token, [])
+
+    def add(self, article: Article) -> int:
+        """Index one article and return its document id."""
+        if article.url is not None and article.url in self._ids_by_url:
+            self.remove(article.url)
+        doc_id = self._next_id
+        self._next_id += 1
+        self._docs[doc_id] = article
+        if article.url is not None:
+            self._ids_by_url[article.url] = doc_id
+        for token in set(self._tokens(article)):
+            insort(self._writable_ids(token), doc_id, key=self._sort_key)
+        return doc_id
+
+    def remove(self, article: Union[Article, str]) -> bool:
+        """Remove an article (or the article with this URL). Returns False if absent."""
+        url = article.url if isinstance(article, Article) else article
+        doc_id = self._ids_by_url.pop(url, None)
+        if doc_id is None:
+            return False
+        key = self._sort_key(doc_id)
+        for token in set(self._tokens(self._docs[doc_id])):
+            ids = self._writable_ids(token)
+            del ids[bisect_left(ids, key, key=self._sort_key)]
+            if not ids:
+                del self._postings[token]
+        del self._docs[doc_id]
+        return True
+
+    def _match(self, query: str, mode: str) -> Sequence[int]:
+        """Document ids matching `query`, in date order."""
+        if mode not in ("and", "or"):
+            raise ValueError(f"mode must be 'and' or 'or', not {mode!r}")
+        clauses = [tokenize(phrase if phrase else word)
+                   for phrase, word in _CLAUSE_RE.findall(query or "")]
+        clauses = [c for c in clauses if c]
+        if not clauses:
+            return []
+        if len(clauses) == 1 and len(clauses[0]) == 1:
+            return self._ids(clauses[0][0])
+
+        matched = None
+        for clause in clauses:
+            ids = set(self._ids(clause[0]))
+            for token in clause[1:]:
+                ids.intersection_update(self._ids(token))
+            if len(clause) > 1:
+                ids = {i for i in ids if self._has_phrase(i, clause)}
+            if matched is None:
+                matched = ids
+            elif mode == "and":
+                matched &= ids
+            else:
+                matched |= ids
+        return sorted(matched, key=self._sort_key)
+
+    def _has_phrase(self, doc_id: int, phrase: List[str]) -> bool:
+        article = self._docs[doc_id]
+        n = len(phrase)
+        for field in (article.title, article.description):
+            tokens = tokenize(field)
+            if any(tokens[i:i + n] == phrase for i in range(len(tokens) - n + 1)):
+                return True
+        return False
+
+    def search(self, query: str, mode: str = "and") -> List[Article]:
+        """Articles matching `query`, oldest first."""
+        return [self._docs[i] for i in self._match(query, mode)]
+
+    def count_by_day(self, query: str, mode: str = "and") -> Dict[str, int]:
+        """Number of matching articles per YYYY-MM-DD day, in date order (undated skipped)."""
+        counts: Dict[str, int] = {}
+        for i in self._match(query, mode):
+            published = self._docs[i].published_at
+            if published:
+                day = published[:10]
+                counts[day] = counts.get(day, 0) + 1
+        return counts
+
+    def save(self, directory: str) -> None:
+        """
+        Write the index to `directory`: docs.jsonl (the articles),
+        lexicon.json (token -> offset/length) and postings.bin (native int32
+        document ids) which load() memory-maps.
+        """
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, "docs.jsonl"), "w", encoding="utf-8") as f:
+            for doc_id, a in self._docs.items():
+                f.write(json.dumps({
+                    "id": doc_id, "url": a.url, "source": a.source, "author": a.author,
+                    "title": a.title, "description": a.description,
+                    "published_at": a.published_at, "content": a.content,
+                }) + "\n")
+
+        lexicon = {}
+        postings = array("i")
+        for token in sorted(set(self._postings) | set(self._mapped_lexicon)):
+            ids = self._ids(token)
+            lexicon[token] = (len(postings), len(ids))
+            postings.extend(ids)
+        # Written beside the old files and swapped in, so an index loaded from
+        # this directory keeps reading its (now unlinked) mapped postings
+        path = os.path.join(directory, "postings.bin")
+        with open(path + ".tmp", "wb") as f:
+            postings.tofile(f)
+        os.replace(path + ".tmp", path)
+        path = os.path.join(directory, "lexicon.json")
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump({"next_id": self._next_id, "terms": lexicon}, f)
+        os.replace(path + ".tmp", path)
+
+    @classmethod
+    def load(cls, directory: str) -> "ArticleIndex":
+        """
+        Open an index written by save(). Postings stay in the memory-mapped
+        file until a term is modified by add()/remove().
+        """
+        index = cls()
+        with open(os.path.join(directory, "docs.jsonl"), "r", encoding="utf-8") as f:
+            for line in f:
+                fields = json.loads(line)
+                doc_id = fields.pop("id")
+                article = Article(**fields)
+                index._docs[doc_id] = article
+                if article.url is not None:
+                    index._ids_by_url[article.url] = doc_id
+        with open(os.path.join(directory, "lexicon.json"), "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        index._next_id = meta["next_id"]
+        index._mapped_lexicon = {t: tuple(v) for t, v in meta["terms"].items()}
+
+        path = os.path.join(directory, "postings.bin")
+        if os.path.getsize(path):
+            with open(path, "rb") as f:
+                index._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            index._mapped = memoryview(index._mmap).cast("i")
+        return index
+
+    def close(self) -> None:
+        """Copy any still-mapped postings into memory and release the file."""
+        for token in list(self._mapped_lexicon):
+            self._writable_ids(token)
+        if self._mapped is not None:
+            self._mapped.release()
+            self._mapped = None
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
@@ -0,0 +1,176 @@
+import sqlite3
+from datetime import datetime, timezone
+from typing import Iterable, List, Optional, Tuple
+from article import Article
+from lazy_import import LazyModule
+
+pd = LazyModule("pandas")
+
+_COLUMNS = ("url", "source", "author", "title", "description", "published_at", "content")
+_EAGER_COLUMNS = ("url", "source", "author", "title", "published_at")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    url TEXT PRIMARY KEY,
+    source TEXT,
+    author TEXT,
+    title TEXT,
+    description TEXT,
+    published_at TEXT,
+    content TEXT,
+    published_day TEXT
+);
+CREATE INDEX IF NOT EXISTS articles_day_source ON articles (published_day, source);
+CREATE TABLE IF NOT EXISTS sync_state (
+    query TEXT PRIMARY KEY,
+    high_water TEXT,
+    synced_at TEXT
+);
+"""
+
+
+class ArticleStore:
+    """
+    Local SQLite store of articles, so repeated runs only fetch what is new.
+
+    Articles are upserted keyed on URL (articles without a URL are skipped).
+    Rows are indexed by published day and source. For each query the store
+    keeps a high-water mark: the newest published_at seen for it. Callers pass
+    that mark as the `from` of their next request.
+    """
+
+    def __init__(self, path: str = "articles.db"):
+        """
+        Open (or create) the store.
+
+        Args:
+            path: SQLite database file (":memory:" for a throwaway store)
+        """
+        self.path = path
+        self._conn = sqlite3.connect(path)
+        self._conn.executescript(_SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    @staticmethod
+    def query_key(endpoint: str, terms: Iterable[str] = (), domain: Optional[str] = None,
+                  language: Optional[str] = None) -> str:
+        """
+        Normalised name for a query, e.g.
+        "everything|domains=bbc.co.uk|language=en|q=change climate".
+        Terms are lowercased and sorted, so argument order does not matter.
+        """
+        q = " ".join(sorted(t.strip().lower() for t in terms if t and t.strip()))
+        parts = [endpoint.strip("/")]
+        if domain:
+            parts.append(f"domains={domain.lower()}")
+        if language:
+            parts.append(f"language={language.lower()}")
+        if q:
+            parts.append(f"q={q}")
+        return "|".join(parts)
+
+    def upsert(self, articles: Iterable[Article]) -> int:
+        """Insert or replace articles by URL. Returns the number of rows written."""
+        rows = [
+            (a.url, a.source, a.author, a.title, a.description, a.published_at, a.content,
+             a.published_at[:10] if a.published_at else None)
+            for a in articles if a.url
+        ]
+        with self._conn:
+            self._conn.executemany(
+                "INSERT INTO articles VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(url) DO UPDATE SET source=excluded.source, author=excluded.author, "
+                "title=excluded.title, description=excluded.description, "
+                "published_at=excluded.published_at, content=excluded.content, "
+                "published_day=excluded.published_day",
+                rows,
+            )
+        return len(rows)
+
+    def high_water_mark(self, query: str) -> Optional[str]:
+        """Newest published_at stored for `query`, or None if never synced."""
+        row = self._conn.execute(
+            "SELECT high_water FROM sync_state WHERE query = ?", (query,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def sync(self, query: str, articles: Iterable[Article]) -> int:
+        """
+        Upsert the articles fetched for `query` and advance its high-water mark.
+
+        Returns:
+            Number of articles written.
+        """
+        articles = list(articles)
+        written = self.upsert(articles)
+        newest = max((a.published_at for a in articles if a.published_at), default=None)
+        mark = max(filter(None, (newest, self.high_water_mark(query))), default=None)
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sync_state VALUES (?, ?, ?)",
+                (query, mark, datetime.now(timezone.utc).isoformat()),
+            )
+        return written
+
+    def _select(self, start: Optional[str], end: Optional[str], source: Optional[str],
+                columns: Tuple[str, ...] = _COLUMNS):
+        clauses, params = [], []
+        if start:
+            clauses.append("published_day >= ?")
+            params.append(start[:10])
+        if end:
+            clauses.append("published_day <= ?")
+            params.append(end[:10])
+        if source:
+            clauses.append("source = ?")
+            params.append(source)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        sql = f"SELECT {', '.join(columns)} FROM articles{where} ORDER BY published_at"
+        return sql, params
+
+    def read_df(self, start: Optional[str] = None, end: Optional[str] = None,
+                source: Optional[str] = None) -> pd.DataFrame:
+        """
+        Stored articles as a DataFrame with NewsProcessor.to_df's columns,
+        oldest first, optionally limited to a day range (YYYY-MM-DD, inclusive)
+        and a source.
+        """
+        sql, params = self._select(start, end, source)
+        return pd.read_sql_query(sql, self._conn, params=params)
+
+    def articles(self, start: Optional[str] = None, end: Optional[str] = None,
+                 source: Optional[str] = None, lazy: bool = False) -> List[Article]:
+        """
+        Stored articles as Article objects, with the same filters as read_df().
+
+        With lazy=True, description and content are not read here. Each is
+        fetched from the store when first accessed, so the store must stay
+        open while they are used.
+        """
+        if not lazy:
+            sql, params = self._select(start, end, source)
+            return [Article(**dict(zip(_COLUMNS, row))) for row in self._conn.execute(sql, params)]
+        sql, params = self._select(start, end, source, _EAGER_COLUMNS + ("rowid",))
+        return [
+            Article.lazy(self, row[-1], row[-1], **dict(zip(_EAGER_COLUMNS, row)))
+            for row in self._conn.execute(sql, params)
+        ]
+
+    def load(self, rowid: int, field: str) -> Optional[str]:
+        """description or content of one stored row, for lazy Articles."""
+        if field not in ("description", "content"):
+            raise ValueError(f"not a lazily loaded field: {field!r}")
+        row = self._conn.execute(f"SELECT {field} FROM articles WHERE rowid = ?",
+                                 (rowid,)).fetchone()
+        return row[0] if row else None
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
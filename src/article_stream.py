@@ -0,0 +1,227 @@
+import codecs
+import json
+import mmap
+import re
+from array import array
+from typing import BinaryIO, Iterable, Iterator, List, Union
+from article import Article
+from article_batch import ArticleBatch
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+_FIELDS = ("url", "source", "author", "title", "description", "publishedAt", "content")
+
+# "description"/"content" keys up to the opening quote of a string value. In
+# valid JSON an unescaped quote only ever delimits a string, so these only
+# match keys. One pattern per key keeps a literal prefix, which re scans for
+# much faster than an alternation.
+_LAZY_KEY_RES = (
+    re.compile(rb'"description"\s*:\s*"'),
+    re.compile(rb'"content"\s*:\s*"'),
+)
+
+
+class _Reader:
+    """Text buffer over a byte stream that pulls more data on demand."""
+
+    def __init__(self, stream, chunk_size: int):
+        if hasattr(stream, "read"):
+            self._chunks = iter(lambda: stream.read(chunk_size), b"")
+        else:
+            self._chunks = iter(stream)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        """Append the next chunk; False once the stream is exhausted."""
+        if self.eof:
+            return False
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            self.eof = True
+            self.buf = self.buf[self.pos:] + self._decoder.decode(b"", final=True)
+        else:
+            self.buf = self.buf[self.pos:] + self._decoder.decode(chunk)
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Next non-whitespace character ("" at end of stream)."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise ValueError(f"Malformed NewsAPI response: expected {char!r}")
+        self.pos += 1
+
+    def value(self):
+        """Decode one complete JSON value, reading more input as needed."""
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if self.fill():
+                    continue
+                raise
+            # A number at the very end of the buffer may continue in the next chunk
+            if end == len(self.buf) and self.fill():
+                continue
+            self.pos = end
+            return value
+
+
+def _to_article(item: dict) -> Article:
+    return Article(**{name: item.get(name) for name in _FIELDS})
+
+
+def iter_articles(
+    stream: Union[BinaryIO, Iterable[bytes]],
+    chunk_size: int = 64 * 1024,
+) -> Iterator[Article]:
+    """
+    Incrementally parse a NewsAPI JSON response and yield its Articles.
+
+    Only one element of the "articles" array is decoded at a time, so the
+    full dict tree of a page never exists in memory.
+
+    Args:
+        stream: binary file-like object with .read(n) (e.g. an open file, or
+            requests' response.raw with decode_content=True), or an iterable
+            of byte chunks (e.g. response.iter_content())
+        chunk_size: bytes per read() call
+
+    Raises:
+        RuntimeError: if the response reports status "error"
+        ValueError: if the response is not a NewsAPI JSON object
+    """
+    reader = _Reader(stream, chunk_size)
+    header = {}
+    reader.expect("{")
+    while reader.peek() != "}":
+        if header:
+            reader.expect(",")
+        key = reader.value()
+        reader.expect(":")
+        if key == "articles" and header.get("status") != "error" and reader.peek() == "[":
+            reader.pos += 1
+            first = True
+            while reader.peek() != "]":
+                if not first:
+                    reader.expect(",")
+                first = False
+                yield _to_article(reader.value())
+            reader.pos += 1
+            header[key] = None
+        else:
+            header[key] = reader.value()
+    if header.get("status") == "error":
+        raise RuntimeError(f"NewsAPI error ({header.get('code')}): {header.get('message')}")
+
+
+def read_batch(
+    stream: Union[BinaryIO, Iterable[bytes]],
+    chunk_size: int = 64 * 1024,
+) -> ArticleBatch:
+    """Incrementally parse a NewsAPI JSON response into an ArticleBatch."""
+    batch = ArticleBatch()
+    for article in iter_articles(stream, chunk_size):
+        batch.append(article)
+    return batch
+
+
+class ResponseBuffer:
+    """
+    A raw NewsAPI response (bytes, or a memory-mapped file) that lazy
+    Articles decode their description and content from on first access.
+
+    articles() parses everything else up front. The description/content
+    strings are only located (byte offsets), never decoded, so building the
+    Articles skips them entirely. The buffer must stay alive and unchanged
+    while its Articles are in use.
+    """
+
+    def __init__(self, data: Union[bytes, mmap.mmap]):
+        self.data = data
+        # Byte offsets of each located string: data[starts[i]:ends[i]]
+        self._starts = array("q")
+        self._ends = array("q")
+
+    @classmethod
+    def open(cls, path: str) -> "ResponseBuffer":
+        """Memory-map a saved response file; pages are read only as needed."""
+        with open(path, "rb") as f:
+            return cls(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def load(self, key: int, field: str) -> str:
+        """Decode the string with index `key` (the field name is not needed)."""
+        raw = self.data[self._starts[key]:self._ends[key]]
+        if b"\\" in raw:
+            return json.loads(b'"' + raw + b'"')
+        return raw.decode("utf-8")
+
+    def _string_end(self, start: int) -> int:
+        """Offset of the quote closing the JSON string that starts at `start`."""
+        data = self.data
+        end = data.find(b'"', start)
+        while end > 0 and data[end - 1] == 0x5C:   # backslash: escaped unless doubled
+            k = end - 1
+            while data[k] == 0x5C:
+                k -= 1
+            if (end - 1 - k) % 2 == 0:
+                break
+            end = data.find(b'"', end + 1)
+        if end < 0:
+            raise ValueError("Malformed NewsAPI response: unterminated string")
+        return end
+
+    def articles(self) -> List[Article]:
+        """
+        Lazy Articles for every element of the response's "articles".
+
+        Raises:
+            RuntimeError: if the response reports status "error"
+            ValueError: if the response is not valid JSON
+        """
+        data = self.data
+        find = data.find
+        starts = sorted(m.end() for key_re in _LAZY_KEY_RES for m in key_re.finditer(data))
+        ends = [find(b'"', start) for start in starts]
+        # Rare: a closing-quote candidate that is really an escaped quote
+        for i, end in enumerate(ends):
+            if end < 0 or data[end - 1] == 0x5C:
+                ends[i] = self._string_end(starts[i])
+
+        # Swap each description/content string for its index, then decode the
+        # (much smaller) remainder in one go
+        base = len(self._starts)
+        pieces = [None] * (2 * len(starts) + 1)
+        pieces[0::2] = [data[lo:hi] for lo, hi in
+                        zip([0] + [end + 1 for end in ends], [start - 1 for start in starts] + [len(data)])]
+        pieces[1::2] = [b"%d" % i for i in range(base, base + len(starts))]
+        self._starts.extend(starts)
+        self._ends.extend(ends)
+        payload = json.loads(b"".join(pieces))
+
+        if payload.get("status") == "error":
+            raise RuntimeError(f"NewsAPI error ({payload.get('code')}): {payload.get('message')}")
+        out = []
+        for item in payload.get("articles") or []:
+            get = item.get
+            description, content = get("description"), get("content")
+            out.append(Article.lazy(
+                self,
+                description if type(description) is int else None,
+                content if type(content) is int else None,
+                url=get("url"), source=get("source"), author=get("author"),
+                title=get("title"), published_at=get("publishedAt"),
+            ))
+        return out
@@ -0,0 +1,147 @@
+"""
+Batch command-line entry point: run the jobs in a JSON job file.
+
+    python src/cli.py jobs.json [--report timings.json]
+
+A job file holds a list of jobs. Each job names exactly one input and any
+number of outputs:
+
+    {"jobs": [{
+        "name": "tech",
+        "response": "responses/tech.json",
+        "dedup": true,
+        "export": "out/tech.csv",
+        "charts": {"out/ai.png": "AI", "out/langs.svg": ["Python", "Rust"]},
+        "freq": "W"
+    }]}
+
+Inputs:
+    response  a saved NewsAPI response file, parsed incrementally
+    store     {"path": ..., "start": ..., "end": ..., "source": ...}: articles
+              from an ArticleStore
+
+Outputs:
+    export    DataFrame file; .csv, .json (records) or .jsonl by extension
+    charts    popularity chart path -> term or list of terms (see
+              NewsProcessor.render_popularity_charts); "freq" sets D/W/M
+
+pandas and matplotlib are only imported by jobs that export or chart, and
+startup plus per-stage timings are reported on stderr (and with --report,
+as JSON).
+"""
+
+import argparse
+import json
+import sys
+import time
+
+_STARTED = time.perf_counter()
+
+from article_stream import iter_articles  # noqa: E402
+from news_processor import NewsProcessor  # noqa: E402
+
+INPUTS = ("response", "store")
+
+
+def load_articles(job: dict):
+    """The articles named by the job's single input."""
+    if not isinstance(job, dict):
+        raise ValueError("a job must be a JSON object")
+    given = [name for name in INPUTS if name in job]
+    if len(given) != 1:
+        raise ValueError(f"a job needs exactly one of {', '.join(INPUTS)}")
+    if "response" in job:
+        with open(job["response"], "rb") as f:
+            return list(iter_articles(f))
+    from article_store import ArticleStore
+    spec = job["store"]
+    spec = {"path": spec} if isinstance(spec, str) else spec
+    if not isinstance(spec, dict) or not spec.get("path"):
+        raise ValueError("a store input needs a path")
+    with ArticleStore(spec["path"]) as store:
+        return store.articles(spec.get("start"), spec.get("end"), spec.get("source"))
+
+
+def export_df(processor: NewsProcessor, articles, path: str, dedup=None) -> int:
+    """Write articles as a DataFrame file; returns the number of rows."""
+    df = processor.to_df(articles, dedup=dedup)
+    if path.endswith(".csv"):
+        df.to_csv(path, index=False)
+    elif path.endswith(".jsonl"):
+        df.to_json(path, orient="records", lines=True)
+    elif path.endswith(".json"):
+        df.to_json(path, orient="records")
+    else:
+        raise ValueError(f"unsupported export format: {path}")
+    return len(df)
+
+
+def run_job(job: dict, processor: NewsProcessor) -> dict:
+    """Run one job; returns its timings (seconds per stage) and row counts."""
+    report = {"name": job.get("name"), "stages": {}}
+
+    def timed(stage, fn):
+        start = time.perf_counter()
+        result = fn()
+        report["stages"][stage] = time.perf_counter() - start
+        return result
+
+    articles = timed("load", lambda: load_articles(job))
+    report["articles"] = len(articles)
+    dedup = job.get("dedup") or None
+    if "export" in job:
+        report["rows"] = timed("export", lambda: export_df(processor, articles, job["export"], dedup))
+    if "charts" in job:
+        timed("charts", lambda: processor.render_popularity_charts(
+            articles, job["charts"], freq=job.get("freq", "D"), dedup=dedup))
+    return report
+
+
+def _log(line: str, quiet: bool) -> None:
+    if not quiet:
+        print(line, file=sys.stderr)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Run NewsAPI jobs from a job file")
+    parser.add_argument("jobfile", help="JSON job file")
+    parser.add_argument("--report", help="Also write timings as JSON to this file")
+    parser.add_argument("-q", "--quiet", action="store_true", help="Don't print timings")
+    args = parser.parse_args(argv)
+
+    startup = time.perf_counter() - _STARTED
+    _log(f"startup {startup * 1000:.0f} ms", args.quiet)
+    try:
+        with open(args.jobfile, encoding="utf-8") as f:
+            spec = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"{args.jobfile}: cannot read job file: {e}", file=sys.stderr)
+        return 2
+    jobs = spec.get("jobs") if isinstance(spec, dict) else spec
+    if not isinstance(jobs, list):
+        print(f'{args.jobfile}: expected a list of jobs or {{"jobs": [...]}}', file=sys.stderr)
+        return 2
+
+    processor = NewsProcessor()
+    reports, failed = [], 0
+    for i, job in enumerate(jobs):
+        name = (job.get("name") if isinstance(job, dict) else None) or f"job{i}"
+        try:
+            report = dict(run_job(job, processor), name=name)
+        except Exception as e:   # one bad job must not stop the rest
+            failed += 1
+            reports.append({"name": name, "error": str(e)})
+            print(f"{name}: failed: {e}", file=sys.stderr)
+            continue
+        reports.append(report)
+        stages = ", ".join(f"{k} {v:.3f}s" for k, v in report["stages"].items())
+        _log(f"{name}: {report['articles']} articles; {stages}", args.quiet)
+
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump({"startup": startup, "jobs": reports}, f, indent=2)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
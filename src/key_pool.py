@@ -0,0 +1,138 @@
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Sequence
+
+# NewsAPI error codes that take a key out of rotation for a while / for good
+THROTTLE_CODES = frozenset({"rateLimited", "apiKeyExhausted"})
+INVALID_CODES = frozenset({"apiKeyInvalid", "apiKeyDisabled", "apiKeyMissing"})
+
+
+class KeyPool:
+    """
+    Spreads NewsAPI requests over several API keys.
+
+    Keys are handed out by smooth weighted round-robin among the keys that
+    are currently usable. A key reported as throttled (rateLimited /
+    apiKeyExhausted) is skipped until its cooldown has passed; a key reported
+    as invalid (apiKeyInvalid and friends) is never handed out again.
+
+    Keys are only ever returned by acquire(). Everything else (usage, repr,
+    error messages) names them by position, "key-0", "key-1", ...
+    """
+
+    def __init__(self, keys: Sequence[str], weights: Optional[Sequence[float]] = None,
+                 cooldown: float = 3600.0, clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            keys: API keys; duplicates and blanks are dropped
+            weights: relative share of requests per key (default: equal)
+            cooldown: seconds a throttled key stays out of rotation
+            clock: time source (monotonic seconds)
+        """
+        self._keys = list(dict.fromkeys(k.strip() for k in keys if k and k.strip()))
+        if not self._keys:
+            raise ValueError("KeyPool needs at least one API key")
+        if weights is None:
+            weights = [1.0] * len(self._keys)
+        if len(weights) != len(self._keys) or any(w <= 0 for w in weights):
+            raise ValueError("weights must be positive, one per distinct key")
+        self.cooldown = cooldown
+        self._clock = clock
+        self._weights = list(weights)
+        self._current = [0.0] * len(self._keys)
+        self._available_at = [0.0] * len(self._keys)
+        self._invalid = [False] * len(self._keys)
+        self._requests = [0] * len(self._keys)
+        self._throttled = [0] * len(self._keys)
+        self._index = {key: i for i, key in enumerate(self._keys)}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __repr__(self) -> str:
+        return f"KeyPool(keys={len(self._keys)}, usable={self.usable})"
+
+    @staticmethod
+    def label(index: int) -> str:
+        """Name under which the key at `index` appears in usage and messages."""
+        return f"key-{index}"
+
+    @property
+    def usable(self) -> int:
+        """Keys that acquire() could return right now."""
+        now = self._clock()
+        return sum(1 for i in range(len(self._keys))
+                   if not self._invalid[i] and self._available_at[i] <= now)
+
+    def acquire(self) -> str:
+        """
+        Next key to send a request with; counts as one request on that key.
+
+        Raises:
+            RuntimeError: if every key is invalid or cooling down
+        """
+        with self._lock:
+            now = self._clock()
+            live = [i for i in range(len(self._keys))
+                    if not self._invalid[i] and self._available_at[i] <= now]
+            if not live:
+                waits = [self._available_at[i] - now for i in range(len(self._keys))
+                         if not self._invalid[i]]
+                if not waits:
+                    raise RuntimeError("No usable NewsAPI key: all keys are invalid")
+                raise RuntimeError(
+                    f"No usable NewsAPI key: all throttled, next free in {min(waits):.0f}s"
+                )
+            total = 0.0
+            for i in live:
+                self._current[i] += self._weights[i]
+                total += self._weights[i]
+            chosen = max(live, key=lambda i: self._current[i])
+            self._current[chosen] -= total
+            self._requests[chosen] += 1
+            return self._keys[chosen]
+
+    def report(self, key: str, code: Optional[str] = None, retry_after: Optional[float] = None) -> None:
+        """
+        Feed back the NewsAPI error code of a request made with `key` (None
+        for success), taking the key out of rotation if needed.
+        """
+        if code in THROTTLE_CODES:
+            self.mark_throttled(key, retry_after)
+        elif code in INVALID_CODES:
+            self.mark_invalid(key)
+
+    def mark_throttled(self, key: str, seconds: Optional[float] = None) -> None:
+        """Skip `key` for `seconds` (default: the pool's cooldown)."""
+        i = self._position(key)
+        with self._lock:
+            self._throttled[i] += 1
+            self._available_at[i] = self._clock() + (self.cooldown if seconds is None else seconds)
+
+    def mark_invalid(self, key: str) -> None:
+        """Never hand out `key` again."""
+        i = self._position(key)
+        with self._lock:
+            self._invalid[i] = True
+
+    def _position(self, key: str) -> int:
+        try:
+            return self._index[key]
+        except KeyError:
+            raise KeyError("API key is not in this pool") from None
+
+    def usage(self) -> List[Dict[str, object]]:
+        """Per-key counters, keys named by label(): requests, throttled, state."""
+        now = self._clock()
+        with self._lock:
+            return [
+                {
+                    "key": self.label(i),
+                    "requests": self._requests[i],
+                    "throttled": self._throttled[i],
+                    "state": "invalid" if self._invalid[i]
+                    else "throttled" if self._available_at[i] > now else "active",
+                }
+                for i in range(len(self._keys))
+            ]
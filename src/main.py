@@ -31,7 +31,7 @@ def main():
     print("\nFiltering articles with authors...")
     df_with_authors = processor.to_df(
         headlines,
-        filter=lambda article: bool(article.author)
+        filter_by=lambda article: bool(article.author)
     )
     print(f"Articles with authors: {len(df_with_authors)}")
 
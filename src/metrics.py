@@ -0,0 +1,182 @@
+import json
+import threading
+from bisect import bisect_left
+from typing import Dict, Optional, Sequence, Tuple
+
+# Upper bounds (seconds) of the default histogram buckets
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_Labels = Tuple[Tuple[str, str], ...]
+
+
+class Histogram:
+    """Observation counts per bucket, plus their sum and total count."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)   # last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self):
+        """(upper bound, observations <= bound) pairs, ending with +Inf."""
+        total = 0
+        for bound, n in zip(self.buckets + (float("inf"),), self.counts):
+            total += n
+            yield bound, total
+
+
+class _Metric:
+    def __init__(self, kind: str, description: str, buckets: Sequence[float]):
+        self.kind = kind
+        self.description = description
+        self.buckets = buckets
+        self.series: Dict[_Labels, object] = {}
+
+
+def _fmt(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def _escape_help(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _escape(value: str) -> str:
+    return _escape_help(value).replace('"', '\\"')
+
+
+def _label_text(labels: _Labels, extra: str = "") -> str:
+    parts = [f'{k}="{_escape(v)}"' for k, v in labels]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+class MetricsRegistry:
+    """
+    In-process registry of counters and histograms, keyed by name and labels,
+    that can be dumped as Prometheus text or JSON.
+
+    on_stage has the hook signature used by NewsProcessor.hooks, so a
+    registry can be attached directly:
+
+        registry = MetricsRegistry()
+        processor = NewsProcessor(hooks=[registry.on_stage])
+
+    Safe to update from several threads.
+    """
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _metric(self, name: str, kind: str, description: str = "",
+                buckets: Sequence[float] = DEFAULT_BUCKETS) -> _Metric:
+        metric = self._metrics.get(name)
+        if metric is None:
+            metric = self._metrics[name] = _Metric(kind, description, buckets)
+        elif metric.kind != kind:
+            raise ValueError(f"metric {name!r} is a {metric.kind}, not a {kind}")
+        return metric
+
+    def counter(self, name: str, description: str = "") -> None:
+        """Declare a counter (optional; inc() declares on first use)."""
+        with self._lock:
+            self._metric(name, "counter", description)
+
+    def histogram(self, name: str, description: str = "",
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        """Declare a histogram with custom buckets (optional; observe() declares on first use)."""
+        with self._lock:
+            self._metric(name, "histogram", description, buckets)
+
+    def inc(self, name: str, value: float = 1, **labels) -> None:
+        """Add `value` to the counter `name` for these labels."""
+        key = tuple(sorted((k, str(v)) for k, v in labels.items()))
+        with self._lock:
+            series = self._metric(name, "counter").series
+            series[key] = series.get(key, 0) + value
+
+    def observe(self, name: str, value: float, **labels) -> None:
+        """Record `value` in the histogram `name` for these labels."""
+        key = tuple(sorted((k, str(v)) for k, v in labels.items()))
+        with self._lock:
+            metric = self._metric(name, "histogram")
+            hist = metric.series.get(key)
+            if hist is None:
+                hist = metric.series[key] = Histogram(metric.buckets)
+            hist.observe(value)
+
+    def get(self, name: str, **labels):
+        """Current counter value or Histogram for these labels (None if unset)."""
+        metric = self._metrics.get(name)
+        if metric is None:
+            return None
+        return metric.series.get(tuple(sorted((k, str(v)) for k, v in labels.items())))
+
+    def on_stage(self, stage: str, seconds: float, rows_in: Optional[int],
+                 rows_out: Optional[int]) -> None:
+        """Hook for one processing stage (e.g. NewsProcessor.to_df)."""
+        self.observe("newsprocessor_stage_seconds", seconds, stage=stage)
+        if rows_in is not None:
+            self.inc("newsprocessor_rows_in_total", rows_in, stage=stage)
+        if rows_out is not None:
+            self.inc("newsprocessor_rows_out_total", rows_out, stage=stage)
+
+    def to_prometheus(self) -> str:
+        """All metrics in the Prometheus text exposition format."""
+        lines = []
+        with self._lock:
+            for name in sorted(self._metrics):
+                metric = self._metrics[name]
+                if metric.description:
+                    lines.append(f"# HELP {name} {_escape_help(metric.description)}")
+                lines.append(f"# TYPE {name} {metric.kind}")
+                for labels in sorted(metric.series):
+                    value = metric.series[labels]
+                    if metric.kind == "counter":
+                        lines.append(f"{name}{_label_text(labels)} {_fmt(value)}")
+                        continue
+                    for bound, total in value.cumulative():
+                        le = 'le="' + _fmt(bound) + '"'
+                        lines.append(f"{name}_bucket{_label_text(labels, le)} {total}")
+                    lines.append(f"{name}_sum{_label_text(labels)} {_fmt(value.sum)}")
+                    lines.append(f"{name}_count{_label_text(labels)} {value.count}")
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def to_dict(self) -> dict:
+        """All metrics as plain data: name -> {type, help (description), series: [...]}."""
+        out = {}
+        with self._lock:
+            for name in sorted(self._metrics):
+                metric = self._metrics[name]
+                series = []
+                for labels in sorted(metric.series):
+                    value = metric.series[labels]
+                    entry = {"labels": dict(labels)}
+                    if metric.kind == "counter":
+                        entry["value"] = value
+                    else:
+                        entry.update(
+                            count=value.count, sum=value.sum,
+                            buckets={_fmt(b): n for b, n in value.cumulative()},
+                        )
+                    series.append(entry)
+                out[name] = {"type": metric.kind, "help": metric.description, "series": series}
+        return out
+
+    def to_json(self, indent: Optional[int] = None) -> str:
+        return json.dumps(self.to_dict(), indent=indent)
+
+    def reset(self) -> None:
+        """Drop all recorded values (declared metrics are forgotten too)."""
+        with self._lock:
+            self._metrics.clear()
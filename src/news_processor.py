@@ -1,116 +1,462 @@
-import pandas as pd
-import matplotlib.pyplot as plt
-from typing import List, Callable, Optional
-from collections import Counter
-from datetime import datetime, timedelta
-from article import Article
+from __future__ import annotations
+
+import functools
+import re
+import time
+from datetime import timezone
+from typing import TYPE_CHECKING, List, Callable, Mapping, Optional, Sequence, Tuple, Union
+from article import Article, parse_published_at, parse_published_series
+from article_batch import ArticleBatch
+from lazy_import import LazyModule
+
+# pandas, matplotlib and numpy (via article_dedup) take most of a second to
+# import; they are loaded on first use so fetch-only jobs don't pay for them
+pd = LazyModule("pandas")
+plt = LazyModule("matplotlib.pyplot")
+_figure = LazyModule("matplotlib.figure")
+
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+    from article_dedup import ArticleDeduplicator
+
+
+# Short names accepted by resample_popularity
+POPULARITY_FREQS = {"D": "D", "W": "W", "M": "MS"}
+
+
+def _draw_popularity(ax, counts: pd.DataFrame) -> None:
+    """Draw a word_popularity result (one line per term) onto `ax`."""
+    for term in counts.columns:
+        ax.plot(counts.index, counts[term], marker="o", label=term)
+    ax.set_xlabel("Date")
+    if len(counts.columns) == 1:
+        term = counts.columns[0]
+        ax.set_ylabel(f'Articles with "{term}" in title')
+        ax.set_title(f'"{term}" popularity in titles over time')
+    else:
+        ax.set_ylabel("Articles with term in title")
+        ax.set_title("Term popularity in titles over time")
+        if len(counts.columns):
+            ax.legend()
+    ax.tick_params(axis="x", labelrotation=45)
+    for label in ax.get_xticklabels():
+        label.set_horizontalalignment("right")
+
+
+def _render_charts(jobs: List[Tuple[str, pd.DataFrame]]) -> None:
+    """Save each (path, counts) chart, reusing one Figure and Axes."""
+    figure = _figure.Figure(layout="tight")
+    ax = figure.add_subplot()
+    for path, counts in jobs:
+        ax.clear()
+        _draw_popularity(ax, counts)
+        figure.savefig(path)
+
+
+def _stage(name: str):
+    """Report each call of the wrapped NewsProcessor method to its hooks as stage `name`."""
+    def wrap(method):
+        @functools.wraps(method)
+        def run(self, articles, *args, **kwargs):
+            if not self.hooks:
+                return method(self, articles, *args, **kwargs)
+            start = time.perf_counter()
+            result = method(self, articles, *args, **kwargs)
+            self._emit(name, start, articles, result)
+            return result
+        return run
+    return wrap
 
 
 class NewsProcessor:
     """
     Class to process and visualize news articles data.
+
+    Callables in `hooks` are called after each processing stage ("dedup",
+    "to_df", "word_popularity", "popularity_figure",
+    "render_popularity_charts") as hook(stage, seconds, rows_in, rows_out);
+    row counts are None where the input or output has no length.
+    MetricsRegistry.on_stage is such a hook.
     """
 
+    COLUMNS = ["url", "source", "author", "title", "description", "published_at", "content"]
+    # Everything but the long text fields
+    META_COLUMNS = ["url", "source", "author", "title", "published_at"]
+
+    def __init__(self, hooks: Optional[List[Callable]] = None):
+        self.hooks = list(hooks or [])
+
+    def _emit(self, stage: str, start: float, articles, result) -> None:
+        seconds = time.perf_counter() - start
+        rows_in = len(articles) if hasattr(articles, "__len__") else None
+        rows_out = len(result) if hasattr(result, "__len__") else None
+        for hook in self.hooks:
+            hook(stage, seconds, rows_in, rows_out)
+
+    @_stage("to_df")
     def to_df(
         self,
-        articles: List[Article],
-        sort_by: Optional[Callable] = None,
-        filter: Optional[Callable] = None,   # match spec/tests: 'filter', not 'filter_func'
+        articles: Union[List[Article], ArticleBatch],
+        sort_by: Optional[Union[Callable, str, List[str]]] = None,
+        filter_by: Optional[Union[Callable, str, Sequence[bool]]] = None,
+        parse_dates: bool = False,
+        dedup: Optional[Union[bool, ArticleDeduplicator]] = None,
+        columns: Optional[Sequence[str]] = None,
+        **legacy,
     ) -> pd.DataFrame:
         """
         Convert list of Article objects to a Pandas DataFrame.
 
+        Callables are applied per article, as before. Column expressions are
+        applied vectorised on the built DataFrame instead.
+
         Args:
-            articles: List[Article]
-            sort_by: Optional function taking an Article -> sort key
-            filter: Optional function taking an Article -> bool (keep if True)
+            articles: List[Article] or ArticleBatch
+            sort_by: Optional function taking an Article -> sort key, or a
+                column name / list of column names to sort by
+                ("published_at" sorts chronologically, missing dates last)
+            filter_by: Optional function taking an Article -> bool (keep if True),
+                a DataFrame.query expression string, or a boolean mask with
+                one entry per input article (applied before dedup and sorting).
+                Also accepted under its earlier names, filter= and filter_func=
+            parse_dates: If True, published_at becomes a UTC datetime64 column
+            dedup: True or an ArticleDeduplicator to drop repeated articles
+                (same normalised URL or near-identical title/content) first
+            columns: Subset of COLUMNS to build, in COLUMNS order. Fields left
+                out are never read, so lazy description/content stay undecoded
+                (e.g. columns=NewsProcessor.META_COLUMNS); a column sort_by
+                must be among them
 
         Returns:
-            pd.DataFrame with one row per article.
+            pd.DataFrame with one row per article. For an ArticleBatch the
+            source/author columns are pandas categoricals.
+        """
+        filter_by = self._legacy_filter(filter_by, legacy)
+        names = self.COLUMNS
+        if columns is not None:
+            unknown = set(columns) - set(self.COLUMNS)
+            if unknown:
+                raise ValueError(f"unknown columns: {sorted(unknown)}")
+            names = [name for name in self.COLUMNS if name in columns]
+        if sort_by is not None and not callable(sort_by):
+            missing = [c for c in ([sort_by] if isinstance(sort_by, str) else sort_by)
+                       if c not in names]
+            if missing:
+                raise ValueError(f"cannot sort by {missing}: not among the built columns")
+
+        if filter_by is not None and not callable(filter_by) and not isinstance(filter_by, str):
+            # A mask refers to input positions, so it goes before dedup and sorting
+            articles = self._apply_mask(articles, filter_by)
+            filter_by = None
+        articles = self._dedupe(articles, dedup)
+        if isinstance(articles, ArticleBatch):
+            df = self._batch_to_df(articles, sort_by, filter_by, names)
+        else:
+            items = list(articles or [])
+
+            # Apply filtering first
+            if callable(filter_by):
+                items = [a for a in items if filter_by(a)]
+
+            # Then apply sorting
+            if callable(sort_by):
+                items = sorted(items, key=sort_by)
+
+            # Build each column directly; each Article attribute becomes a column
+            df = pd.DataFrame(
+                {name: [getattr(a, name) for a in items] for name in names},
+                columns=names,
+            )
+
+        if isinstance(filter_by, str):
+            df = df.query(filter_by)
+
+        if parse_dates and "published_at" in df:
+            df["published_at"] = parse_published_series(df["published_at"])
+
+        if sort_by is not None and not callable(sort_by):
+            df = df.sort_values(sort_by, kind="stable", na_position="last",
+                                key=self._sort_key)
+
+        if (filter_by is not None and not callable(filter_by)) or \
+                (sort_by is not None and not callable(sort_by)):
+            df = df.reset_index(drop=True)
+        return df
+
+    def to_arrow(self, articles: Union[List[Article], ArticleBatch]):
+        """
+        Articles as a pyarrow.RecordBatch: source/author dictionary-encoded,
+        published_at a UTC timestamp. Needs the optional pyarrow package;
+        see arrow_io for Parquet/IPC files.
+        """
+        from arrow_io import to_arrow
+        return to_arrow(articles)
+
+    def _batch_to_df(
+        self,
+        batch: ArticleBatch,
+        sort_by: Optional[Union[Callable, str, List[str]]],
+        filter_by: Optional[Union[Callable, str, Sequence[bool]]],
+        names: Sequence[str] = ArticleBatch.FIELDS,
+    ) -> pd.DataFrame:
+        """
+        Columnar to_df path: callables still see Article views, but only row
+        indices are filtered/sorted and the DataFrame is built from columns.
         """
-        items = list(articles or [])
+        if callable(filter_by) or callable(sort_by):
+            indices = range(len(batch))
+            if callable(filter_by):
+                indices = [i for i in indices if filter_by(batch[i])]
+            if callable(sort_by):
+                indices = sorted(indices, key=lambda i: sort_by(batch[i]))
+            batch = batch.take(indices)
+
+        data = {}
+        for name in names:
+            if name in ("source", "author"):
+                data[name] = pd.Categorical.from_codes(batch.codes(name), batch.categories(name))
+            else:
+                data[name] = batch.column(name)
+        return pd.DataFrame(data, columns=list(names))
 
-        # Apply filtering first
-        if filter is not None:
-            items = [a for a in items if filter(a)]
+    @staticmethod
+    def _legacy_filter(filter_by, legacy: dict):
+        """filter_by, or the same argument passed as filter= / filter_func=."""
+        for name in ("filter", "filter_func"):
+            if name in legacy:
+                if filter_by is not None:
+                    raise TypeError(f"to_df() got both filter_by and {name}")
+                filter_by = legacy.pop(name)
+        if legacy:
+            raise TypeError(f"to_df() got unexpected keyword arguments {sorted(legacy)}")
+        return filter_by
 
-        # Then apply sorting
-        if sort_by is not None:
-            items = sorted(items, key=sort_by)
+    @staticmethod
+    def _apply_mask(articles, mask: Sequence[bool]):
+        """Keep the articles whose mask entry is true."""
+        keep = pd.Series(mask, dtype=bool).to_numpy()
+        if not isinstance(articles, ArticleBatch):
+            articles = list(articles or [])
+        if len(keep) != len(articles):
+            raise ValueError(f"filter mask has {len(keep)} entries for {len(articles)} articles")
+        if isinstance(articles, ArticleBatch):
+            return articles.take(keep.nonzero()[0].tolist())
+        return [a for a, k in zip(articles, keep) if k]
 
-        # Convert to records; each Article attribute becomes a column
-        records = [{
-            "url": a.url,
-            "source": a.source,
-            "author": a.author,
-            "title": a.title,
-            "description": a.description,
-            "published_at": a.published_at,   # using snake_case attribute from your Article
-            "content": a.content,
-        } for a in items]
+    def _dedupe(self, articles, dedup):
+        if not dedup:
+            return articles
+        if dedup is True:
+            from article_dedup import ArticleDeduplicator
+            dedup = ArticleDeduplicator()
+        start = time.perf_counter()
+        result = dedup.dedupe(articles)
+        if self.hooks:
+            self._emit("dedup", start, articles, result)
+        return result
 
-        columns = ["url", "source", "author", "title", "description", "published_at", "content"]
-        return pd.DataFrame.from_records(records, columns=columns)
+    def _sort_key(self, col: pd.Series) -> pd.Series:
+        # published_at strings sort chronologically rather than lexically
+        if col.name == "published_at":
+            return parse_published_series(col)
+        # Batch categories are in first-seen order; sort by value as the list path does
+        if isinstance(col.dtype, pd.CategoricalDtype):
+            return col.cat.reorder_categories(sorted(col.cat.categories))
+        return col
 
-    def plot_word_popularity(self, articles: List[Article], search_term: str):
+    @_stage("word_popularity")
+    def word_popularity(
+        self,
+        articles: Union[List[Article], ArticleBatch],
+        terms: Sequence[str],
+        dedup: Optional[Union[bool, ArticleDeduplicator]] = None,
+    ) -> pd.DataFrame:
+        """
+        Count, per UTC day, the articles whose title contains each term.
+
+        Dates are parsed once for all articles and every term is matched in a
+        single regex pass over the lowercased titles (case-insensitive).
+
+        Args:
+            articles: List[Article] or ArticleBatch
+            terms: Search terms; blank terms are ignored
+            dedup: True or an ArticleDeduplicator to count repeated articles once
+
+        Returns:
+            pd.DataFrame indexed by every day from the first to the last dated
+            article (index name "date"), one column per term, zero-filled.
+        """
+        labels = list(dict.fromkeys(t for t in terms if (t or "").strip()))
+
+        articles = self._dedupe(articles, dedup)
+        if isinstance(articles, ArticleBatch):
+            titles = articles.column("title")
+            published = articles.column("published_at")
+        else:
+            items = list(articles or [])
+            titles = [a.title for a in items]
+            published = [getattr(a, "published_at", None) for a in items]
+
+        days = self._published_days(pd.Series(published, dtype=object))
+        dated = days.notna()
+        if not dated.any():
+            return pd.DataFrame(columns=labels, index=pd.DatetimeIndex([], name="date"), dtype="int64")
+        index = pd.date_range(days[dated].min(), days[dated].max(), freq="D", name="date")
+
+        keys = list(dict.fromkeys(t.strip().lower() for t in labels))
+        counts = pd.DataFrame(index=index)
+        if keys:
+            # Lookahead alternation, longest first: at each position it reports
+            # the longest term starting there, and every shorter term starting at
+            # the same position is a prefix of it.
+            ordered = sorted(keys, key=len, reverse=True)
+            pattern = "(?=(" + "|".join(re.escape(k) for k in ordered) + "))"
+            prefixes = {m: [k for k in keys if m.startswith(k)] for m in keys}
+
+            lowered = pd.Series(titles, dtype=object)[dated].fillna("").astype(str).str.lower()
+            hits = lowered.str.findall(pattern).explode().dropna().map(prefixes).explode()
+            # An article counts once per term, however often the term appears
+            pairs = pd.DataFrame({"row": hits.index, "term": hits.to_numpy()}).drop_duplicates()
+            pairs["day"] = days.loc[pairs["row"]].to_numpy()
+            counts = (
+                pairs.groupby(["day", "term"]).size().unstack(fill_value=0)
+                .reindex(index=index, columns=keys, fill_value=0)
+            )
+
+        return pd.DataFrame(
+            {label: counts[label.strip().lower()] for label in labels}, index=index
+        ).astype("int64")
+
+    def _published_days(self, published: pd.Series) -> pd.Series:
+        """
+        Vectorised _extract_date_from_published: the UTC day of each value as
+        a naive midnight timestamp (NaT if missing or unparseable), the same
+        day PopularityTracker buckets it under.
+        """
+        return parse_published_series(published).dt.tz_localize(None).dt.floor("D")
+
+    def resample_popularity(self, counts: pd.DataFrame, freq: str = "D") -> pd.DataFrame:
+        """
+        Aggregate a word_popularity result into coarser bins so long ranges
+        plot a bounded number of points: "D" (unchanged), "W" (weeks ending
+        Sunday), "M" (calendar months, labelled by first day) or any pandas
+        offset alias.
+        """
+        freq = POPULARITY_FREQS.get(freq, freq)
+        if freq == "D" or counts.empty:
+            return counts
+        return counts.resample(freq).sum()
+
+    @_stage("popularity_figure")
+    def popularity_figure(
+        self,
+        articles: Union[List[Article], ArticleBatch],
+        terms: Union[str, Sequence[str]],
+        path: Optional[str] = None,
+        freq: str = "D",
+        figure: Optional[Figure] = None,
+        dedup: Optional[Union[bool, ArticleDeduplicator]] = None,
+    ) -> Figure:
+        """
+        Render word popularity (one line per term) without pyplot, so it
+        works on headless servers and never blocks.
+
+        Args:
+            articles: List[Article] or ArticleBatch
+            terms: One search term or several
+            path: If given, also save the chart there (format from the
+                extension, e.g. .png or .svg)
+            freq: "D", "W", "M" or a pandas offset alias to aggregate by
+            figure: Figure to draw into (cleared first) instead of a new one
+            dedup: True or an ArticleDeduplicator to count repeated articles once
+
+        Returns:
+            The matplotlib Figure.
+        """
+        terms = [terms] if isinstance(terms, str) else list(terms)
+        counts = self.resample_popularity(self.word_popularity(articles, terms, dedup=dedup), freq)
+        if figure is None:
+            figure = _figure.Figure(layout="tight")
+        figure.clear()
+        _draw_popularity(figure.add_subplot(), counts)
+        if path is not None:
+            figure.savefig(path)
+        return figure
+
+    @_stage("render_popularity_charts")
+    def render_popularity_charts(
+        self,
+        articles: Union[List[Article], ArticleBatch],
+        charts: Mapping[str, Union[str, Sequence[str]]],
+        freq: str = "D",
+        workers: int = 1,
+        dedup: Optional[Union[bool, ArticleDeduplicator]] = None,
+    ) -> List[str]:
+        """
+        Write many popularity charts in one call.
+
+        Counts for every term are computed once, in one word_popularity pass.
+        Each process then reuses a single Figure/Axes for all of its charts.
+
+        Args:
+            articles: List[Article] or ArticleBatch
+            charts: Output path -> term (or list of terms) to draw in that chart
+            freq: "D", "W", "M" or a pandas offset alias to aggregate by
+            workers: Processes to render in (1 renders in this process)
+            dedup: True or an ArticleDeduplicator to count repeated articles once
+
+        Returns:
+            The paths written, in the order given.
+        """
+        # Blank terms are dropped, as word_popularity does
+        wanted = {path: list(dict.fromkeys(t for t in ([t] if isinstance(t, str) else t)
+                                           if (t or "").strip()))
+                  for path, t in charts.items()}
+        all_terms = list(dict.fromkeys(t for ts in wanted.values() for t in ts))
+        counts = self.resample_popularity(
+            self.word_popularity(articles, all_terms, dedup=dedup), freq
+        )
+        jobs = [(path, counts[terms]) for path, terms in wanted.items()]
+
+        if workers <= 1 or len(jobs) <= 1:
+            _render_charts(jobs)
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+            size = -(-len(jobs) // workers)
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                list(pool.map(_render_charts, [jobs[i:i + size] for i in range(0, len(jobs), size)]))
+        return list(wanted)
+
+    def plot_word_popularity(
+        self,
+        articles: Union[List[Article], ArticleBatch],
+        search_term: str,
+        dedup: Optional[Union[bool, ArticleDeduplicator]] = None,
+    ):
         """
         Plot the frequency (count of articles whose title contains the term) per day.
+
+        With dedup (True or an ArticleDeduplicator), repeated articles count once.
         """
         term = (search_term or "").strip().lower()
         if not term:
             print("No search term provided.")
             return
 
-        per_day = Counter()
-        all_days = set()
-
-        for a in articles or []:
-            day = self._extract_date_from_published(getattr(a, "published_at", None))
-            if not day:
-                continue
-            all_days.add(day)
-            title = (a.title or "").lower()
-            if term in title:             # presence in title (per spec)
-                per_day[day] += 1
-
-        if not all_days:
+        counts = self.word_popularity(articles, [search_term], dedup=dedup)
+        if counts.empty:
             print("No dated articles to plot.")
             return
 
-        day_objs = sorted(datetime.strptime(d, "%Y-%m-%d").date() for d in all_days)
-        start, end = day_objs[0], day_objs[-1]
-
-        xs, ys = [], []
-        cur = start
-        while cur <= end:
-            d_str = cur.strftime("%Y-%m-%d")
-            xs.append(cur)
-            ys.append(per_day.get(d_str, 0))
-            cur += timedelta(days=1)
-
         plt.figure()
-        plt.plot(xs, ys, marker="o")
-        plt.xlabel("Date")
-        plt.ylabel(f'Articles with "{search_term}" in title')
-        plt.title(f'"{search_term}" popularity in titles over time')
-        plt.xticks(rotation=45, ha="right")
+        _draw_popularity(plt.gca(), counts)
         plt.tight_layout()
         plt.show()
 
     def _extract_date_from_published(self, published_at: Optional[str]) -> Optional[str]:
         """
-        Extract YYYY-MM-DD from ISO 8601 timestamp (e.g., '2023-10-01T12:00:00Z').
-        """
-        if not published_at:
-            return None
-        s = str(published_at).strip()
-        try:
-            if s.endswith("Z"):
-                s = s[:-1] + "+00:00"
-            dt = datetime.fromisoformat(s)
-            return dt.date().isoformat()
-        except Exception:
-            try:
-                return datetime.strptime(s[:10], "%Y-%m-%d").date().isoformat()
-            except Exception:
-                return None
+        Extract the UTC day YYYY-MM-DD from an ISO 8601 timestamp
+        (e.g., '2023-10-01T12:00:00Z'; '2023-10-01T23:30:00-05:00' is 2023-10-02).
+        """
+        dt = parse_published_at(published_at or None)
+        return dt.astimezone(timezone.utc).date().isoformat() if dt else None
@@ -0,0 +1,192 @@
+import json
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Union
+from article import Article
+from article_batch import ArticleBatch
+from lazy_import import LazyModule
+
+pd = LazyModule("pandas")
+
+_DAY = timedelta(days=1)
+_HOUR = timedelta(hours=1)
+
+
+class PopularityTracker:
+    """
+    Incremental word popularity for a fixed set of watched terms.
+
+    Articles are fed in as they arrive (add()/update()). Each one is counted
+    once per term its title contains (case-insensitive, as in
+    NewsProcessor.word_popularity), in a per-day and a per-hour bucket of
+    its UTC publication time. Only the newest `days` day buckets and `hours`
+    hour buckets are kept. Older buckets are dropped as newer articles
+    arrive, and articles older than both windows are ignored (counted in
+    `late`). Memory is bounded by the window sizes times the number of terms,
+    plus the URLs of articles counted within the window, which are kept to
+    ignore repeats.
+
+    series() and totals() read only the buckets, never past articles, so
+    dashboards can refresh them cheaply; snapshot()/restore() persist the
+    state between runs.
+    """
+
+    def __init__(self, terms: Sequence[str], days: int = 30, hours: int = 48):
+        """
+        Args:
+            terms: Watched search terms; blank terms are ignored
+            days: Day buckets kept (sliding window length in days)
+            hours: Hour buckets kept (sliding window length in hours)
+        """
+        if days < 1 or hours < 0:
+            raise ValueError("days must be >= 1 and hours >= 0")
+        self.terms = list(dict.fromkeys(t for t in terms if (t or "").strip()))
+        self.days = days
+        self.hours = hours
+        self._keys = [t.strip().lower() for t in self.terms]
+        # bucket start ("YYYY-MM-DD" / "YYYY-MM-DDTHH") -> one count per term
+        self._daily: Dict[str, List[int]] = {}
+        self._hourly: Dict[str, List[int]] = {}
+        self._urls: Dict[str, Set[str]] = {}   # day -> URLs counted that day
+        self._newest: Optional[datetime] = None
+        self._day_cutoff = self._hour_cutoff = ""
+        self.late = 0
+
+    def __repr__(self) -> str:
+        return (f"PopularityTracker(terms={self.terms!r}, days={self.days}, hours={self.hours}, "
+                f"buckets={len(self._daily) + len(self._hourly)})")
+
+    def add(self, article: Article) -> bool:
+        """Count one article. Returns True if it fell inside the window."""
+        dt = article.published_datetime
+        if dt is None:
+            return False
+        if dt.utcoffset():
+            dt = dt.astimezone(timezone.utc)
+        iso = dt.isoformat()
+        day, hour = iso[:10], iso[:13]
+        if self._newest is None or dt > self._newest:
+            advanced = self._newest is None or hour > self._newest.isoformat()[:13]
+            self._newest = dt
+            if advanced:
+                self._expire()
+
+        in_days = day >= self._day_cutoff
+        in_hours = self.hours > 0 and hour >= self._hour_cutoff
+        if not (in_days or in_hours):
+            self.late += 1
+            return False
+
+        title = (article.title or "").lower()
+        hits = [i for i, key in enumerate(self._keys) if key in title]
+        if not hits:
+            return True
+        if article.url:
+            seen = self._urls.setdefault(day, set())
+            if article.url in seen:
+                return True
+            seen.add(article.url)
+        for buckets, key, live in ((self._daily, day, in_days), (self._hourly, hour, in_hours)):
+            if live:
+                counts = buckets.get(key)
+                if counts is None:
+                    counts = buckets[key] = [0] * len(self._keys)
+                for i in hits:
+                    counts[i] += 1
+        return True
+
+    def update(self, articles: Union[Iterable[Article], ArticleBatch]) -> int:
+        """Count a batch of articles. Returns how many fell inside the window."""
+        return sum(self.add(a) for a in articles)
+
+    def _expire(self) -> None:
+        """Move the window cutoffs up to the newest article and drop older buckets."""
+        day_cutoff = self._day_cutoff = \
+            (self._newest - (self.days - 1) * _DAY).isoformat()[:10]
+        hour_cutoff = self._hour_cutoff = \
+            (self._newest - max(self.hours - 1, 0) * _HOUR).isoformat()[:13]
+        # URLs are kept as long as either window still covers their day
+        url_cutoff = min(day_cutoff, hour_cutoff[:10]) if self.hours else day_cutoff
+        for key in [k for k in self._daily if k < day_cutoff]:
+            del self._daily[key]
+        for key in [k for k in self._urls if k < url_cutoff]:
+            del self._urls[key]
+        for key in [k for k in self._hourly if k < hour_cutoff]:
+            del self._hourly[key]
+
+    def series(self, freq: str = "D") -> "pd.DataFrame":
+        """
+        Current counts per bucket, oldest first: a DataFrame indexed by
+        every day (freq="D", index name "date") or hour (freq="H", index
+        name "hour") of the window that has data, one int column per
+        term, zero-filled. Aggregate further with
+        NewsProcessor.resample_popularity (e.g. tumbling weeks).
+        """
+        if freq not in ("D", "H"):
+            raise ValueError(f"freq must be 'D' or 'H', not {freq!r}")
+        buckets = self._daily if freq == "D" else self._hourly
+        name = "date" if freq == "D" else "hour"
+        if not buckets:
+            return pd.DataFrame(columns=self.terms, index=pd.DatetimeIndex([], name=name),
+                                dtype="int64")
+        keys = sorted(buckets)
+        fmt = "%Y-%m-%d" if freq == "D" else "%Y-%m-%dT%H"
+        index = pd.date_range(datetime.strptime(keys[0], fmt), datetime.strptime(keys[-1], fmt),
+                              freq="D" if freq == "D" else "h", name=name)
+        labels = index.strftime(fmt)
+        zero = [0] * len(self._keys)
+        rows = [buckets.get(label, zero) for label in labels]
+        return pd.DataFrame(rows, index=index, columns=self.terms, dtype="int64")
+
+    def totals(self, days: Optional[int] = None, hours: Optional[int] = None) -> Dict[str, int]:
+        """
+        Per-term counts over the last `days` days or `hours` hours up to the
+        newest article (default: the whole day window).
+        """
+        if self._newest is None:
+            return {t: 0 for t in self.terms}
+        if hours is not None:
+            if hours > self.hours:
+                raise ValueError(f"only the last {self.hours} hours are kept")
+            buckets = self._hourly
+            cutoff = (self._newest - (hours - 1) * _HOUR).isoformat()[:13]
+        else:
+            days = self.days if days is None else days
+            if days > self.days:
+                raise ValueError(f"only the last {self.days} days are kept")
+            buckets = self._daily
+            cutoff = (self._newest - (days - 1) * _DAY).isoformat()[:10]
+        sums = [0] * len(self._keys)
+        for key, counts in buckets.items():
+            if key >= cutoff:
+                for i, n in enumerate(counts):
+                    sums[i] += n
+        return dict(zip(self.terms, sums))
+
+    def snapshot(self, path: str) -> None:
+        """Write the tracker's state to `path` (JSON, replaced atomically)."""
+        state = {
+            "terms": self.terms, "days": self.days, "hours": self.hours,
+            "newest": self._newest.isoformat() if self._newest else None,
+            "late": self.late, "daily": self._daily, "hourly": self._hourly,
+            "urls": {day: sorted(urls) for day, urls in self._urls.items()},
+        }
+        tmp = f"{path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp, path)
+
+    @classmethod
+    def restore(cls, path: str) -> "PopularityTracker":
+        """Rebuild a tracker from a snapshot() file."""
+        with open(path, encoding="utf-8") as f:
+            state = json.load(f)
+        tracker = cls(state["terms"], days=state["days"], hours=state["hours"])
+        tracker.late = state["late"]
+        tracker._daily = state["daily"]
+        tracker._hourly = state["hourly"]
+        tracker._urls = {day: set(urls) for day, urls in state["urls"].items()}
+        if state["newest"]:
+            tracker._newest = datetime.fromisoformat(state["newest"])
+            tracker._expire()
+        return tracker
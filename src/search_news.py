@@ -1,24 +1,58 @@
+import os
+from typing import Optional, Sequence
+from key_pool import KeyPool
+
+
 class SearchNews:
     BASE_URL = "https://newsapi.org/v2"
 
-    def __init__(self, api_key_file: str = "api_key.txt"):
+    def __init__(self, api_key_file: str = "api_key.txt", env_var: Optional[str] = None,
+                 weights: Optional[Sequence[float]] = None, cooldown: float = 3600.0):
         """
-        Initialize SearchNews by reading API key from file.
+        Initialize SearchNews by reading API keys from file (or environment).
 
         Args:
-            api_key_file: Path to file containing the API key (default: 'api_key.txt')
+            api_key_file: Path to file containing the API key, or several keys
+                one per line; blank lines and lines starting with "#" are
+                skipped (default: 'api_key.txt')
+            env_var: If given and set, read the keys from this environment
+                variable instead (separated by commas or whitespace)
+            weights: Relative share of requests per key, one per key in file
+                order; a repeated key keeps its first weight
+            cooldown: Seconds a rate-limited key stays out of rotation
         """
-        try:
-            with open(api_key_file, "r", encoding="utf-8") as f:
-                key = f.read().strip()
-        except FileNotFoundError as e:
-            # Required by the test: raise FileNotFoundError for bad path
-            raise FileNotFoundError(
-                f"API key file not found: {api_key_file}"
-            ) from e
+        text = os.environ.get(env_var, "") if env_var else ""
+        if text.strip():
+            keys = text.replace(",", " ").split()
+        else:
+            try:
+                with open(api_key_file, "r", encoding="utf-8") as f:
+                    lines = f.read().splitlines()
+            except FileNotFoundError as e:
+                # Required by the test: raise FileNotFoundError for bad path
+                raise FileNotFoundError(
+                    f"API key file not found: {api_key_file}"
+                ) from e
+            keys = [line.strip() for line in lines
+                    if line.strip() and not line.strip().startswith("#")]
 
-        if not key:
+        if not keys:
             # Empty file should be an error too
             raise ValueError(f"API key file '{api_key_file}' is empty.")
+        if weights is None:
+            keys = list(dict.fromkeys(keys))
+        else:
+            if len(weights) != len(keys):
+                raise ValueError(f"got {len(weights)} weights for {len(keys)} API keys")
+            # A repeated key keeps the weight of its first occurrence
+            first = {}
+            for key, weight in zip(keys, weights):
+                first.setdefault(key, weight)
+            keys, weights = list(first), list(first.values())
+
+        # Requests draw keys from the pool; api_key stays the first one
+        self.keys = KeyPool(keys, weights=weights, cooldown=cooldown)
+        self.api_key = keys[0]
 
-        self.api_key = key
+    def __repr__(self) -> str:
+        return f"SearchNews(keys={len(self.keys)})"
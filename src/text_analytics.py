@@ -0,0 +1,179 @@
+import math
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Dict, List, Optional, Tuple, Union
+import pandas as pd
+from article import Article
+from article_batch import ArticleBatch
+from article_index import tokenize
+
+STOPWORDS = frozenset("""
+a about after all also an and any are as at be been but by can could did do does for from
+had has have he her his how i if in into is it its just more most new no not of on one or
+our out over said says she so than that the their them there they this to up was we were
+what when which who will with would you your
+""".split())
+
+# One row per article: (text, day, source). Plain strings pickle far smaller
+# than Article objects when shipped to worker processes.
+_Row = Tuple[str, Optional[str], Optional[str]]
+
+
+def ngrams(text: Optional[str], n: int = 1) -> List[str]:
+    """Word n-grams of `text`, lowercased, with stopwords removed first."""
+    tokens = [t for t in tokenize(text) if t not in STOPWORDS and not t.isdigit()]
+    if n == 1:
+        return tokens
+    return [" ".join(tokens[i:i + n]) for i in range(len(tokens) - n + 1)]
+
+
+def _count_chunk(rows: List[_Row], n: int, by: Optional[str]) -> Dict[Optional[str], Counter]:
+    """Worker: n-gram counts per group ("day", "source" or None for everything)."""
+    counts: Dict[Optional[str], Counter] = {}
+    for text, day, source in rows:
+        group = day if by == "day" else source if by == "source" else None
+        if by is not None and group is None:
+            continue
+        counts.setdefault(group, Counter()).update(ngrams(text, n))
+    return counts
+
+
+class TextAnalytics:
+    """
+    Term analytics over article title, description and content: n-gram
+    frequencies, per-day / per-source TF-IDF and trending terms.
+
+    Articles are reduced to compact (text, day, source) rows and counted in
+    chunks across a process pool; partial counters are merged in the parent.
+    With workers=1 everything runs in-process.
+    """
+
+    def __init__(self, workers: Optional[int] = None, chunk_size: int = 5000,
+                 fields: Tuple[str, ...] = ("title", "description", "content")):
+        """
+        Args:
+            workers: worker processes (None = os.cpu_count(), 1 = no pool)
+            chunk_size: articles per task sent to a worker
+            fields: Article fields whose text is analysed
+        """
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.fields = fields
+
+    def _rows(self, articles: Union[List[Article], ArticleBatch]) -> List[_Row]:
+        if isinstance(articles, ArticleBatch):
+            texts = zip(*(articles.column(f) for f in self.fields))
+            days = articles.column("published_at")
+            sources = articles.column("source")
+        else:
+            items = list(articles or [])
+            texts = ([getattr(a, f) for f in self.fields] for a in items)
+            days = [a.published_at for a in items]
+            sources = [a.source for a in items]
+        return [
+            (" ".join(t for t in text if t), day[:10] if day else None, source)
+            for text, day, source in zip(texts, days, sources)
+        ]
+
+    def _counts(self, articles, n: int, by: Optional[str]) -> Dict[Optional[str], Counter]:
+        rows = self._rows(articles)
+        chunks = [rows[i:i + self.chunk_size] for i in range(0, len(rows), self.chunk_size)]
+        if self.workers == 1 or len(chunks) <= 1:
+            parts = [_count_chunk(chunk, n, by) for chunk in chunks]
+        else:
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                parts = list(pool.map(_count_chunk, chunks, repeat(n), repeat(by)))
+
+        merged: Dict[Optional[str], Counter] = {}
+        for part in parts:
+            for group, counter in part.items():
+                if group in merged:
+                    merged[group].update(counter)
+                else:
+                    merged[group] = counter
+        return merged
+
+    def ngram_frequencies(self, articles: Union[List[Article], ArticleBatch], n: int = 1,
+                          top: Optional[int] = None) -> pd.DataFrame:
+        """
+        Most frequent n-grams across all articles.
+
+        Returns:
+            pd.DataFrame with columns ["ngram", "count"], most frequent first
+            (ties in alphabetical order).
+        """
+        counter = self._counts(articles, n, None).get(None, Counter())
+        ranked = sorted(counter.items(), key=lambda r: (-r[1], r[0]))
+        return pd.DataFrame(ranked[:top], columns=["ngram", "count"])
+
+    def tfidf(self, articles: Union[List[Article], ArticleBatch], by: str = "day",
+              n: int = 1, top: int = 10) -> pd.DataFrame:
+        """
+        TF-IDF of n-grams, treating each day (by="day") or source
+        (by="source") as one document. Articles without that field are skipped.
+
+        Returns:
+            pd.DataFrame with columns [by, "ngram", "count", "tfidf"], the
+            `top` highest-scoring n-grams per group, groups in sorted order.
+        """
+        if by not in ("day", "source"):
+            raise ValueError(f"by must be 'day' or 'source', not {by!r}")
+        groups = self._counts(articles, n, by)
+        doc_freq = Counter()
+        for counter in groups.values():
+            doc_freq.update(counter.keys())
+        n_docs = len(groups)
+
+        records = []
+        for group in sorted(groups):
+            counter = groups[group]
+            total = sum(counter.values())
+            scored = sorted(
+                ((term, count, count / total * (math.log((1 + n_docs) / (1 + doc_freq[term])) + 1))
+                 for term, count in counter.items()),
+                key=lambda r: (-r[2], r[0]),
+            )
+            records.extend((group, term, count, score) for term, count, score in scored[:top])
+        return pd.DataFrame(records, columns=[by, "ngram", "count", "tfidf"])
+
+    def trending(self, articles: Union[List[Article], ArticleBatch], k: int = 10,
+                 recent_days: int = 1, n: int = 1, min_count: int = 2) -> pd.DataFrame:
+        """
+        Top-k n-grams whose share of the last `recent_days` days most exceeds
+        their share of the earlier days.
+
+        Returns:
+            pd.DataFrame with columns ["ngram", "recent", "baseline", "score"],
+            highest score first. Only n-grams seen at least `min_count` times
+            recently are ranked.
+
+        Raises:
+            ValueError: unless 1 <= recent_days < number of dated days, so
+                there is both a recent window and a baseline
+        """
+        if recent_days < 1:
+            raise ValueError(f"recent_days must be at least 1, not {recent_days}")
+        by_day = self._counts(articles, n, "day")
+        days = sorted(day for day in by_day if day is not None)
+        if recent_days >= len(days):
+            raise ValueError(f"recent_days={recent_days} leaves no baseline: "
+                             f"the articles span {len(days)} day(s)")
+        recent, baseline = Counter(), Counter()
+        for day in days[-recent_days:]:
+            recent.update(by_day[day])
+        for day in days[:-recent_days]:
+            baseline.update(by_day[day])
+
+        recent_total = sum(recent.values()) or 1
+        baseline_total = sum(baseline.values()) or 1
+        vocab = len(set(recent) | set(baseline)) or 1
+        scored = []
+        for term, count in recent.items():
+            if count < min_count:
+                continue
+            # Add-one smoothing so terms unseen in the baseline get a finite score
+            score = (count / recent_total) / ((baseline[term] + 1) / (baseline_total + vocab))
+            scored.append((term, count, baseline[term], score))
+        scored.sort(key=lambda r: (-r[3], r[0]))
+        return pd.DataFrame(scored[:k], columns=["ngram", "recent", "baseline", "score"])